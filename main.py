@@ -364,10 +364,12 @@ def main():
         exit_code = app.exec()
         
         logger.info(f"Application exited with code {exit_code}")
+        logger.complete()
         sys.exit(exit_code)
         
     except Exception as e:
         logger.exception(f"Application crashed: {e}")
+        logger.complete()
         sys.exit(1)
 
 
@@ -1,5 +1,6 @@
 """Nginx configuration generator with performance baseline and security hardening."""
 
+import threading
 from pathlib import Path
 from typing import Dict, Any, Optional
 from jinja2 import Environment, FileSystemLoader, Template
@@ -45,6 +46,11 @@ class ConfigGenerator:
             keep_trailing_newline=True
         )
         
+        # 已编译模板缓存：站点类型 -> Template
+        self._template_cache: Dict[str, Template] = {}
+        # 预览在线程池中生成，模板的首次创建与编译需串行
+        self._template_lock = threading.Lock()
+        
         # 注册自定义过滤器
         self._register_filters()
         
@@ -113,16 +119,8 @@ class ConfigGenerator:
             # 准备模板上下文（包含性能基线）
             context = self._prepare_template_context(site_config)
             
-            # 根据站点类型选择模板
-            template_name = f"{site_config.site_type}_site.conf.j2"
-            
-            # 确保模板存在，如果不存在则创建默认模板
-            template_path = self.template_dir / template_name
-            if not template_path.exists():
-                self._create_default_template(site_config.site_type, template_name)
-            
-            # 渲染模板
-            template = self.jinja_env.get_template(template_name)
+            # 根据站点类型选择模板并渲染
+            template = self._get_template(site_config.site_type)
             config_content = template.render(**context)
             
             logger.info(f"Generated config for site: {site_config.site_name}")
@@ -133,6 +131,31 @@ class ConfigGenerator:
             logger.error(f"Failed to generate config for {site_config.site_name}: {e}")
             raise
     
+    def _get_template(self, site_type: str) -> Template:
+        """
+        获取站点类型对应的已编译模板
+        
+        首次使用时检查模板文件并编译，之后直接复用，避免每次生成都stat模板文件
+        """
+        template = self._template_cache.get(site_type)
+        if template is not None:
+            return template
+        
+        with self._template_lock:
+            # 等待锁期间可能已由其他线程编译完成
+            template = self._template_cache.get(site_type)
+            if template is None:
+                template_name = f"{site_type}_site.conf.j2"
+                
+                # 确保模板存在，如果不存在则创建默认模板
+                template_path = self.template_dir / template_name
+                if not template_path.exists():
+                    self._create_default_template(site_type, template_name)
+                
+                template = self.jinja_env.get_template(template_name)
+                self._template_cache[site_type] = template
+        return template
+    
     def _prepare_template_context(self, site_config: SiteConfigBase) -> Dict[str, Any]:
         """
         准备模板上下文，注入性能基线和安全加固
@@ -29,6 +29,8 @@ class LanguageManager(QObject):
         super().__init__()
         self.current_language = "en"
         self.translations: Dict[str, Dict[str, Any]] = {}
+        # Resolved (language, key) -> text cache; translations are static after load
+        self._lookup_cache: Dict[tuple, str] = {}
         self._load_translations()
         
         # Auto-detect system language on initialization
@@ -104,6 +106,7 @@ class LanguageManager(QObject):
             "delete": "Delete",
             "confirm_delete": "Confirm Delete",
             "delete_confirm_message": "Are you sure you want to delete site '{name}'?",
+            "delete_sites_confirm_message": "Are you sure you want to delete these {count} sites: {names}?",
             
             "operation_success": "Operation Success",
             "operation_failed": "Operation Failed",
@@ -226,6 +229,7 @@ class LanguageManager(QObject):
                 "delete": "删除",
                 "confirm_delete": "确认删除",
                 "delete_confirm_message": "确定要删除站点 '{name}' 吗？",
+                "delete_sites_confirm_message": "确定要删除这 {count} 个站点（{names}）吗？",
                 
                 "operation_success": "操作成功",
                 "operation_failed": "操作失败",
@@ -341,18 +345,11 @@ class LanguageManager(QObject):
             Translated string (falls back to key if not found)
         """
         try:
-            # Get translation for current language
-            lang_dict = self.translations.get(self.current_language, {})
-            text = lang_dict.get(key, "")
-            
-            # Fallback to English if not found
-            if not text and self.current_language != "en":
-                en_dict = self.translations.get("en", {})
-                text = en_dict.get(key, key)
-            
-            # If still not found, use key itself
-            if not text:
-                text = key
+            cache_key = (self.current_language, key)
+            text = self._lookup_cache.get(cache_key)
+            if text is None:
+                text = self._resolve(key)
+                self._lookup_cache[cache_key] = text
             
             # Format with parameters if provided
             if kwargs:
@@ -368,6 +365,36 @@ class LanguageManager(QObject):
             logger.error(f"Translation error for key '{key}': {e}")
             return key
     
+    def get_many(self, keys) -> Dict[str, str]:
+        """
+        Get several translated strings at once.
+        
+        Args:
+            keys: Iterable of translation keys
+            
+        Returns:
+            Mapping of key to translated string
+        """
+        get = self.get
+        return {key: get(key) for key in keys}
+    
+    def _resolve(self, key: str) -> str:
+        """Look up the raw translation for key in the current language with fallbacks."""
+        # Get translation for current language
+        lang_dict = self.translations.get(self.current_language, {})
+        text = lang_dict.get(key, "")
+        
+        # Fallback to English if not found
+        if not text and self.current_language != "en":
+            en_dict = self.translations.get("en", {})
+            text = en_dict.get(key, key)
+        
+        # If still not found, use key itself
+        if not text:
+            text = key
+        
+        return text
+    
     def get_language_name(self, language_code: str = None) -> str:
         """
         Get display name for a language.
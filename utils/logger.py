@@ -28,7 +28,8 @@ def init_logger(log_dir: str = "logs"):
                "<level>{level: <8}</level> | "
                "<cyan>{name}</cyan>:<cyan>{line}</cyan> - "
                "<level>{message}</level>",
-        colorize=True
+        colorize=True,
+        enqueue=True  # 由后台线程写出，不阻塞GUI线程
         # 不指定 encoding，让 Python 自动处理控制台编码
     )
     
@@ -39,7 +40,8 @@ def init_logger(log_dir: str = "logs"):
         format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{line} - {message}",
         rotation="00:00",  # 每天午夜轮转
         retention="10 days",  # 保留10天
-        encoding="utf-8"
+        encoding="utf-8",
+        enqueue=True
     )
     
     # 错误日志（单独文件）
@@ -51,7 +53,8 @@ def init_logger(log_dir: str = "logs"):
         retention="10 days",
         encoding="utf-8",
         backtrace=True,
-        diagnose=True
+        diagnose=True,
+        enqueue=True
     )
     
     logger.info("Logger initialized successfully")
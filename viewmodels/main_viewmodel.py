@@ -1,5 +1,7 @@
 """Main ViewModel - Business logic coordinator."""
 
+import threading
+from collections import OrderedDict
 from typing import Optional, List, Dict, Any, Tuple
 from pathlib import Path
 import platform
@@ -15,6 +17,9 @@ from services.config_manager import ConfigManager
 from utils.language_manager import LanguageManager
 from utils.encoding_utils import read_file_robust
 
+# 配置预览缓存的最大条目数
+PREVIEW_CACHE_SIZE = 64
+
 
 class StatusUpdateThread(QThread):
     """
@@ -30,6 +35,7 @@ class StatusUpdateThread(QThread):
         super().__init__()
         self.nginx_service = nginx_service
         self._running = True
+        self._stop_event = threading.Event()  # stop()时立即唤醒等待中的线程
         self.interval = 2000  # 2秒间隔
         
     def run(self):
@@ -43,12 +49,13 @@ class StatusUpdateThread(QThread):
                 logger.error(f"Status update thread error: {e}")
                 self.error_occurred.emit(str(e))
             
-            # 等待指定间隔
-            self.msleep(self.interval)
+            # 等待指定间隔（可被stop()提前打断）
+            self._stop_event.wait(self.interval / 1000)
     
     def stop(self):
         """停止线程."""
         self._running = False
+        self._stop_event.set()
         self.quit()
         self.wait()
 
@@ -89,15 +96,30 @@ class MainViewModel(QObject):
         self.language_manager = LanguageManager()
         
         # State management
-        self.sites: List[SiteConfigBase] = []
+        self._sites: List[SiteConfigBase] = []
+        self._site_index: Optional[Dict[str, SiteConfigBase]] = None  # 站点名称索引，按需重建
         self.current_site: Optional[SiteConfigBase] = None
         self.nginx_status: Optional[NginxStatus] = None
         
+        # 配置预览缓存：(站点类型, 配置JSON) -> 生成的配置，按最近使用淘汰
+        self._preview_cache: OrderedDict[Tuple[str, str], str] = OrderedDict()
+        
         # 使用后台线程进行状态监控（替代QTimer）
         self.status_thread: Optional[StatusUpdateThread] = None
         
         logger.info("MainViewModel initialized")
     
+    @property
+    def sites(self) -> List[SiteConfigBase]:
+        """站点列表."""
+        return self._sites
+    
+    @sites.setter
+    def sites(self, sites: List[SiteConfigBase]):
+        """替换站点列表（同时使名称索引失效）."""
+        self._sites = sites
+        self._site_index = None
+    
     def initialize(self):
         """初始化应用 - 包括Nginx检查、配置同步和状态监控."""
         logger.info("=" * 60)
@@ -254,6 +276,7 @@ class MainViewModel(QObject):
             
             # 添加站点
             self.sites.append(site_config)
+            self._site_index = None
             
             # 生成配置
             if self._deploy_config():
@@ -262,6 +285,7 @@ class MainViewModel(QObject):
                 return True
             else:
                 self.sites.remove(site_config)  # 回滚
+                self._site_index = None
                 return False
                 
         except Exception as e:
@@ -290,6 +314,7 @@ class MainViewModel(QObject):
             # 更新站点
             self.sites.remove(old_site)
             self.sites.append(site_config)
+            self._site_index = None
             
             # 重新部署
             if self._deploy_config():
@@ -300,6 +325,7 @@ class MainViewModel(QObject):
                 # 回滚
                 self.sites.remove(site_config)
                 self.sites.append(old_site)
+                self._site_index = None
                 return False
                 
         except Exception as e:
@@ -334,6 +360,7 @@ class MainViewModel(QObject):
             
             # 从站点列表中移除
             self.sites.remove(site)
+            self._site_index = None
             
             # 重新部署配置（这会刷新站点列表）
             if self._deploy_config():
@@ -343,6 +370,7 @@ class MainViewModel(QObject):
             else:
                 # 如果部署失败，回滚操作（但配置文件已经删除，无法回滚）
                 self.sites.append(site)
+                self._site_index = None
                 self.error_occurred.emit(f"Failed to delete site '{site_name}': Configuration deployment failed")
                 return False
                 
@@ -351,6 +379,55 @@ class MainViewModel(QObject):
             self.error_occurred.emit(f"Failed to delete site: {e}")
             return False
     
+    def delete_sites(self, site_names: List[str]) -> bool:
+        """
+        批量删除站点（只部署一次配置、刷新一次列表）
+        
+        Args:
+            site_names: 站点名称列表
+            
+        Returns:
+            是否成功
+        """
+        if len(site_names) == 1:
+            return self.delete_site(site_names[0])
+        
+        try:
+            wanted = set(site_names)
+            removed = [s for s in self.sites if s.site_name in wanted]
+            missing = wanted.difference(s.site_name for s in removed)
+            if missing:
+                names = ", ".join(f"'{name}'" for name in sorted(missing))
+                self.error_occurred.emit(f"Sites not found: {names}")
+                return False
+            
+            # 删除站点配置文件（在从列表移除之前）
+            if hasattr(self, 'config_manager') and self.config_manager:
+                for site in removed:
+                    try:
+                        self.config_manager.delete_site_config(site.site_name)
+                    except Exception as e:
+                        logger.warning(f"Failed to delete site config file for '{site.site_name}': {e}")
+            
+            # 从站点列表中移除（保留原列表以便部署失败时按原顺序恢复）
+            original_sites = self.sites[:]
+            self.sites = [s for s in self.sites if s.site_name not in wanted]
+            
+            # 重新部署配置（这会刷新站点列表）
+            if self._deploy_config():
+                self.load_sites()
+                self.operation_completed.emit(True, f"{len(removed)} sites deleted successfully")
+                return True
+            else:
+                self.sites = original_sites
+                self.error_occurred.emit("Failed to delete sites: Configuration deployment failed")
+                return False
+                
+        except Exception as e:
+            logger.error(f"Failed to delete sites: {e}")
+            self.error_occurred.emit(f"Failed to delete sites: {e}")
+            return False
+    
     def generate_config_preview(self, site_config: SiteConfigBase) -> str:
         """
         生成配置预览
@@ -362,7 +439,16 @@ class MainViewModel(QObject):
             配置内容
         """
         try:
-            config_content = self.config_generator.generate_config(site_config)
+            # 相同配置直接复用上次生成的结果，不再重新渲染模板
+            key = (type(site_config).__name__, site_config.json())
+            config_content = self._preview_cache.get(key)
+            if config_content is None:
+                config_content = self.config_generator.generate_config(site_config)
+                self._preview_cache[key] = config_content
+                if len(self._preview_cache) > PREVIEW_CACHE_SIZE:
+                    self._preview_cache.popitem(last=False)
+            else:
+                self._preview_cache.move_to_end(key)
             self.config_generated.emit(config_content)
             return config_content
         except Exception as e:
@@ -487,10 +573,10 @@ class MainViewModel(QObject):
     
     def get_site_by_name(self, site_name: str) -> Optional[SiteConfigBase]:
         """根据名称获取站点."""
-        try:
-            return next((s for s in self.sites if s.site_name == site_name), None)
-        except Exception:
-            return None
+        if self._site_index is None:
+            # 逆序构建，重名时与原先的线性查找一样取第一个
+            self._site_index = {s.site_name: s for s in reversed(self.sites)}
+        return self._site_index.get(site_name)
     
     def update_nginx_path(self, nginx_path: str, config_path: str):
         """更新Nginx和配置路径."""
@@ -2,9 +2,18 @@
 
 from .main_window import MainWindow
 from .site_list_widget import SiteListWidget
-from .site_config_dialog import StaticSiteConfigDialog, PHPSiteConfigDialog, ProxySiteConfigDialog
 from .status_bar import StatusBar
 
+# Site config dialogs are only needed once the user opens one; import them on first access
+_LAZY_DIALOGS = ("StaticSiteConfigDialog", "PHPSiteConfigDialog", "ProxySiteConfigDialog")
+
+
+def __getattr__(name):
+    if name in _LAZY_DIALOGS:
+        from . import site_config_dialog
+        return getattr(site_config_dialog, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 __all__ = [
     "MainWindow",
     "SiteListWidget",
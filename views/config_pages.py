@@ -1,14 +1,125 @@
 """Configuration pages for different site types."""
 
+from collections import OrderedDict, namedtuple
+from itertools import count
+from typing import Optional
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QFormLayout, 
     QLineEdit, QPushButton, QCheckBox, QLabel, QFileDialog,
-    QTextEdit, QGroupBox, QComboBox, QSpinBox, QSplitter
+    QTextEdit, QGroupBox, QComboBox, QSpinBox, QSplitter, QApplication
 )
-from PySide6.QtCore import Qt, Signal, Slot
+from PySide6.QtCore import (
+    Qt, Signal, Slot, QTimer, QSignalBlocker, QObject, QRunnable, QThreadPool,
+    QRegularExpression
+)
+from PySide6.QtGui import QFont, QRegularExpressionValidator
 from loguru import logger
 from models.site_config import SiteConfigBase, StaticSiteConfig, PHPSiteConfig, ProxySiteConfig
 
+# 预览刷新防抖间隔（毫秒）
+PREVIEW_DEBOUNCE_MS = 50
+
+# 预览结果缓存容量（LRU）
+PREVIEW_CACHE_SIZE = 16
+
+# 表单默认值（三个页面共享同一份字符串对象）
+DEFAULT_LISTEN_PORT = 80
+DEFAULT_SERVER_NAME = "localhost"
+DEFAULT_INDEX_FILE = "index.html"
+DEFAULT_PHP_SOCKET = "/run/php/php-fpm.sock"
+DEFAULT_PHP_HOST = "127.0.0.1"
+DEFAULT_PHP_PORT = 9000
+DEFAULT_LOCATION_PATH = "/"
+
+# 后端地址格式：与ProxySiteConfig一致，只要求http://或https://前缀
+PROXY_URL_PATTERN = r"^https?://.*$"
+
+# 页面标识：后台预览结果按页面标识分发
+_PAGE_TOKENS = count(1)
+
+# 预览区域等宽字体（首次使用时创建，所有页面共享；QFont需在QApplication之后构造）
+_PREVIEW_FONT: Optional[QFont] = None
+
+
+def _get_preview_font() -> QFont:
+    """获取共享的预览字体."""
+    global _PREVIEW_FONT
+    if _PREVIEW_FONT is None:
+        _PREVIEW_FONT = QFont("Courier New", 9)
+        _PREVIEW_FONT.setStyleHint(QFont.Monospace)
+    return _PREVIEW_FONT
+
+
+# 表单字段描述：属性名、标签翻译键、控件工厂、触发预览的信号名、是否左对齐（不拉伸）
+FieldSpec = namedtuple("FieldSpec", "attr label_key widget_factory signal compact")
+
+
+def _create_line_edit(placeholder_key: str):
+    """创建带占位提示的输入框工厂."""
+    def factory(language_manager):
+        edit = QLineEdit()
+        edit.setPlaceholderText(language_manager.get(placeholder_key))
+        return edit
+    return factory
+
+
+def _create_port_spin(language_manager):
+    """创建端口输入框."""
+    spin = QSpinBox()
+    spin.setRange(1, 65535)
+    spin.setValue(DEFAULT_LISTEN_PORT)
+    return spin
+
+
+# 通用表单结构
+COMMON_FORM_SCHEMA = (
+    FieldSpec("site_name_edit", "site_name", _create_line_edit("site_name_placeholder"), "textChanged", False),
+    FieldSpec("port_spin", "listen_port", _create_port_spin, "valueChanged", True),
+    FieldSpec("server_name_edit", "server_name", _create_line_edit("server_name_placeholder"), "textChanged", False),
+)
+
+
+class _PreviewSignals(QObject):
+    """预览生成任务的回传信号（在GUI线程中接收）."""
+    
+    finished = Signal(int, int, object, str)  # 页面标识, 请求序号, 缓存键, 配置内容
+    failed = Signal(int, int, str)  # 页面标识, 请求序号, 错误信息
+
+
+# 所有页面共享的回传信号对象，挂在QApplication下，生命周期长于任何页面和后台任务
+_PREVIEW_SIGNALS: Optional[_PreviewSignals] = None
+
+
+def _get_preview_signals() -> _PreviewSignals:
+    """获取共享的预览回传信号对象（需在GUI线程中首次调用）."""
+    global _PREVIEW_SIGNALS
+    if _PREVIEW_SIGNALS is None:
+        _PREVIEW_SIGNALS = _PreviewSignals(QApplication.instance())
+    return _PREVIEW_SIGNALS
+
+
+class _PreviewTask(QRunnable):
+    """在线程池中生成预览配置的任务."""
+    
+    def __init__(self, config_generator, config: SiteConfigBase, token: int, seq: int, key: tuple):
+        """初始化预览任务."""
+        super().__init__()
+        self.config_generator = config_generator
+        self.config = config
+        self.token = token
+        self.seq = seq
+        self.key = key
+        self.signals = _get_preview_signals()
+    
+    def run(self):
+        """生成配置并通过信号回传结果."""
+        try:
+            config_content = self.config_generator.generate_config(self.config)
+        except Exception as e:
+            self.signals.failed.emit(self.token, self.seq, str(e))
+        else:
+            self.signals.finished.emit(self.token, self.seq, self.key, config_content)
+
 
 class BaseConfigPage(QWidget):
     """
@@ -28,6 +139,33 @@ class BaseConfigPage(QWidget):
         self.page_title = page_title
         self.original_site_name: str = ""
         
+        # 预览防抖定时器：连续的表单信号合并为一次配置生成
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(PREVIEW_DEBOUNCE_MS)
+        self._preview_timer.timeout.connect(self._do_update_preview)
+        
+        # 预览缓存：配置内容 -> 生成结果（LRU）
+        self._preview_cache: OrderedDict[tuple, str] = OrderedDict()
+        # 当前预览文本，内容未变化时跳过文档重建
+        self._last_preview_str: Optional[str] = None
+        # 页面隐藏期间的预览请求只做标记，显示时再生成
+        self._preview_dirty = False
+        
+        # 最近一次构造配置对象失败的原因（模型校验错误），显示在预览中
+        self._config_error: Optional[str] = None
+        # 带校验器的输入控件：输入不完整时不构造配置对象
+        self._validated_widgets: list[QLineEdit] = []
+        
+        # 后台生成预览：每次请求递增序号，过期结果直接丢弃
+        # 回传信号由所有页面共享，按页面标识区分；页面销毁后连接随之断开
+        self._preview_token = next(_PAGE_TOKENS)
+        self._gen_seq = 0
+        self._thread_pool = QThreadPool.globalInstance()
+        signals = _get_preview_signals()
+        signals.finished.connect(self._on_preview_generated)
+        signals.failed.connect(self._on_preview_failed)
+        
         self._setup_ui()
         self._connect_signals()
         
@@ -75,14 +213,13 @@ class BaseConfigPage(QWidget):
         
         self.preview_text = QTextEdit()
         self.preview_text.setReadOnly(True)
-        self.preview_text.setFontFamily("Courier New")
-        self.preview_text.setFontPointSize(9)
+        self.preview_text.setFont(_get_preview_font())
         preview_layout.addWidget(self.preview_text)
         
         preview_controls = QHBoxLayout()
         
         self.update_preview_btn = QPushButton(self.language_manager.get("update_preview"))
-        self.update_preview_btn.clicked.connect(self._update_preview)
+        self.update_preview_btn.clicked.connect(self._do_update_preview)
         preview_controls.addWidget(self.update_preview_btn)
         
         self.copy_btn = QPushButton(self.language_manager.get("copy_config"))
@@ -99,24 +236,17 @@ class BaseConfigPage(QWidget):
         common_layout = QFormLayout()
         common_layout.setSpacing(8)
         
-        # 站点名称
-        self.site_name_edit = QLineEdit()
-        self.site_name_edit.setPlaceholderText(self.language_manager.get("site_name_placeholder"))
-        common_layout.addRow(self.language_manager.get("site_name") + ":", self.site_name_edit)
-        
-        # 监听端口
-        port_layout = QHBoxLayout()
-        self.port_spin = QSpinBox()
-        self.port_spin.setRange(1, 65535)
-        self.port_spin.setValue(80)
-        port_layout.addWidget(self.port_spin)
-        port_layout.addStretch()
-        common_layout.addRow(self.language_manager.get("listen_port") + ":", port_layout)
-        
-        # 服务器名称
-        self.server_name_edit = QLineEdit()
-        self.server_name_edit.setPlaceholderText(self.language_manager.get("server_name_placeholder"))
-        common_layout.addRow(self.language_manager.get("server_name") + ":", self.server_name_edit)
+        for spec in COMMON_FORM_SCHEMA:
+            widget = spec.widget_factory(self.language_manager)
+            setattr(self, spec.attr, widget)
+            label = self.language_manager.get(spec.label_key) + ":"
+            if spec.compact:
+                row_layout = QHBoxLayout()
+                row_layout.addWidget(widget)
+                row_layout.addStretch()
+                common_layout.addRow(label, row_layout)
+            else:
+                common_layout.addRow(label, widget)
         
         common_group.setLayout(common_layout)
         layout.addWidget(common_group)
@@ -193,10 +323,9 @@ class BaseConfigPage(QWidget):
     def _connect_signals(self):
         """连接信号."""
         # 表单值改变时更新预览
-        self.site_name_edit.textChanged.connect(self._update_preview)
-        self.port_spin.valueChanged.connect(self._update_preview)
-        self.server_name_edit.textChanged.connect(self._update_preview)
-        self.https_check.stateChanged.connect(self._update_preview)
+        for spec in COMMON_FORM_SCHEMA:
+            getattr(getattr(self, spec.attr), spec.signal).connect(self._update_preview)
+        # https_check 已通过 _on_https_toggled 触发预览，此处不再重复连接
         self.ssl_cert_edit.textChanged.connect(self._update_preview)
         self.ssl_key_edit.textChanged.connect(self._update_preview)
     
@@ -209,10 +338,44 @@ class BaseConfigPage(QWidget):
         """获取配置（子类实现）."""
         pass
     
-    def load_site(self, site_config: SiteConfigBase):
-        """加载站点（子类实现）."""
+    def _load_specific_fields(self, site_config: SiteConfigBase):
+        """加载特定字段（子类实现）."""
         pass
     
+    def _form_widgets(self) -> list:
+        """返回所有会触发预览的表单控件（子类扩展）."""
+        return [
+            self.site_name_edit, self.port_spin, self.server_name_edit,
+            self.https_check, self.ssl_cert_edit, self.ssl_key_edit
+        ]
+    
+    def load_site(self, site_config: SiteConfigBase):
+        """
+        加载站点
+        
+        批量赋值期间阻断表单信号，结束后只刷新一次预览
+        """
+        self.original_site_name = site_config.site_name
+        
+        blockers = [QSignalBlocker(widget) for widget in self._form_widgets()]
+        try:
+            self.site_name_edit.setText(site_config.site_name)
+            self.port_spin.setValue(site_config.listen_port)
+            self.server_name_edit.setText(site_config.server_name)
+            self.https_check.setChecked(site_config.enable_https)
+            self._set_https_fields_enabled(site_config.enable_https)
+            
+            if site_config.enable_https:
+                self.ssl_cert_edit.setText(site_config.ssl_cert_path or "")
+                self.ssl_key_edit.setText(site_config.ssl_key_path or "")
+            
+            self._load_specific_fields(site_config)
+        finally:
+            for blocker in blockers:
+                blocker.unblock()
+        
+        self._update_preview()
+    
     def new_site(self):
         """新建站点."""
         self.original_site_name = ""
@@ -229,34 +392,48 @@ class BaseConfigPage(QWidget):
     # 槽函数
     def _on_https_toggled(self, state):
         """HTTPS开关切换."""
-        enabled = state == Qt.Checked
+        self._set_https_fields_enabled(state == Qt.Checked)
+        self._update_preview()
+    
+    def _set_https_fields_enabled(self, enabled: bool):
+        """启用/禁用SSL相关控件."""
         self.ssl_cert_edit.setEnabled(enabled)
         self.ssl_key_edit.setEnabled(enabled)
         self.cert_browse_btn.setEnabled(enabled)
         self.key_browse_btn.setEnabled(enabled)
-        self._update_preview()
     
     def _browse_cert(self):
         """浏览证书."""
-        file_path, _ = QFileDialog.getOpenFileName(
-            self,
-            self.language_manager.get("select_ssl_cert"),
-            "",
-            self.language_manager.get("cert_filter")
-        )
-        if file_path:
-            self.ssl_cert_edit.setText(file_path)
+        self._browse_file(self.ssl_cert_edit, "select_ssl_cert", "cert_filter")
     
     def _browse_key(self):
         """浏览私钥."""
+        self._browse_file(self.ssl_key_edit, "select_ssl_key", "key_filter")
+    
+    def _browse_root(self):
+        """浏览根目录（仅含root_edit的子类使用）."""
+        self._browse_directory(self.root_edit, "select_root_dir")
+    
+    def _browse_file(self, target_edit: QLineEdit, title_key: str, filter_key: str):
+        """浏览文件并写入目标输入框."""
         file_path, _ = QFileDialog.getOpenFileName(
             self,
-            self.language_manager.get("select_ssl_key"),
+            self.language_manager.get(title_key),
             "",
-            self.language_manager.get("key_filter")
+            self.language_manager.get(filter_key)
         )
         if file_path:
-            self.ssl_key_edit.setText(file_path)
+            target_edit.setText(file_path)
+    
+    def _browse_directory(self, target_edit: QLineEdit, title_key: str):
+        """浏览目录并写入目标输入框."""
+        directory = QFileDialog.getExistingDirectory(
+            self,
+            self.language_manager.get(title_key),
+            target_edit.text() or ""
+        )
+        if directory:
+            target_edit.setText(directory)
     
     def _on_save(self):
         """保存配置."""
@@ -270,31 +447,97 @@ class BaseConfigPage(QWidget):
         self._update_preview()
     
     def _update_preview(self):
-        """更新预览."""
-        try:
-            config = self.get_config()
-            if config:
-                config_content = self.main_viewmodel.config_generator.generate_config(config)
-                self.preview_text.setPlainText(config_content)
-            else:
-                self.preview_text.setPlainText(self.language_manager.get("invalid_config"))
-        except Exception as e:
-            self.preview_text.setPlainText(self.language_manager.get("config_error") + f": {str(e)}")
+        """请求更新预览（防抖，定时器重启即合并；页面隐藏时延后到显示）."""
+        if not self.isVisible():
+            self._preview_dirty = True
+            return
+        self._preview_timer.start()
+    
+    def _do_update_preview(self):
+        """立即更新预览（缓存未命中时交给线程池生成）."""
+        self._preview_timer.stop()
+        self._preview_dirty = False
+        self._gen_seq += 1
+        
+        if not all(widget.hasAcceptableInput() for widget in self._validated_widgets):
+            self._set_preview_text(self.language_manager.get("invalid_config"))
+            return
+        
+        self._config_error = None
+        config = self.get_config()
+        if not config:
+            text = self.language_manager.get("invalid_config")
+            if self._config_error:
+                text = f"{text}: {self._config_error}"
+            self._set_preview_text(text)
+            return
+        
+        key = (type(config).__name__, config.json())
+        cached = self._preview_cache.get(key)
+        if cached is not None:
+            self._preview_cache.move_to_end(key)
+            self._set_preview_text(cached)
+            return
+        
+        self._thread_pool.start(_PreviewTask(
+            self.main_viewmodel.config_generator, config, self._preview_token, self._gen_seq, key
+        ))
+    
+    @Slot(int, int, object, str)
+    def _on_preview_generated(self, token: int, seq: int, key: tuple, config_content: str):
+        """后台生成完成."""
+        if token != self._preview_token:
+            return
+        # 过期结果仍然有效，写入缓存以备复用
+        self._preview_cache[key] = config_content
+        if len(self._preview_cache) > PREVIEW_CACHE_SIZE:
+            self._preview_cache.popitem(last=False)
+        
+        if seq == self._gen_seq:
+            self._set_preview_text(config_content)
+    
+    @Slot(int, int, str)
+    def _on_preview_failed(self, token: int, seq: int, error: str):
+        """后台生成失败."""
+        if token != self._preview_token or seq != self._gen_seq:
+            return
+        logger.opt(lazy=True).debug("Preview generation failed: {}", lambda: error)
+        # 重复的错误文本由_set_preview_text去重，不会重建文档
+        self._set_preview_text(f"{self.language_manager.get('config_error')}: {error}")
+    
+    def showEvent(self, event):
+        """显示事件：补做隐藏期间被延后的预览更新."""
+        super().showEvent(event)
+        if self._preview_dirty:
+            self._do_update_preview()
+    
+    def _set_preview_text(self, text: str):
+        """设置预览文本，与当前内容相同时不重建文档."""
+        if text == self._last_preview_str:
+            return
+        self._last_preview_str = text
+        self.preview_text.setPlainText(text)
     
     def _copy_config(self):
         """复制配置到剪贴板."""
-        self.preview_text.selectAll()
-        self.preview_text.copy()
+        # 直接复用已缓存的预览文本，避免全选带来的重绘
+        text = self._last_preview_str
+        if text is None:
+            text = self.preview_text.toPlainText()
+        QApplication.clipboard().setText(text)
     
     def _clear_fields(self):
         """清空表单."""
         self.site_name_edit.clear()
-        self.port_spin.setValue(80)
-        self.server_name_edit.setText("localhost")
+        self.port_spin.setValue(DEFAULT_LISTEN_PORT)
+        self.server_name_edit.setText(DEFAULT_SERVER_NAME)
         self.https_check.setChecked(False)
         self.ssl_cert_edit.clear()
         self.ssl_key_edit.clear()
         self.preview_text.clear()
+        self._last_preview_str = None
+        # 使尚未返回的后台生成结果失效
+        self._gen_seq += 1
 
 
 class StaticSitePage(BaseConfigPage):
@@ -322,7 +565,7 @@ class StaticSitePage(BaseConfigPage):
         specific_layout.addRow(self.language_manager.get("root_dir"), root_layout)
         
         # 索引文件
-        self.index_edit = QLineEdit("index.html")
+        self.index_edit = QLineEdit(DEFAULT_INDEX_FILE)
         self.index_edit.setPlaceholderText(self.language_manager.get("index_placeholder"))
         specific_layout.addRow(self.language_manager.get("index_file"), self.index_edit)
         
@@ -336,47 +579,30 @@ class StaticSitePage(BaseConfigPage):
     def get_config(self) -> StaticSiteConfig:
         """获取静态站点配置."""
         try:
+            https = self.https_check.isChecked()
             return StaticSiteConfig(
                 site_name=self.site_name_edit.text(),
                 listen_port=self.port_spin.value(),
                 server_name=self.server_name_edit.text(),
-                enable_https=self.https_check.isChecked(),
-                ssl_cert_path=self.ssl_cert_edit.text() if self.https_check.isChecked() else None,
-                ssl_key_path=self.ssl_key_edit.text() if self.https_check.isChecked() else None,
+                enable_https=https,
+                ssl_cert_path=self.ssl_cert_edit.text() if https else None,
+                ssl_key_path=self.ssl_key_edit.text() if https else None,
                 root_path=self.root_edit.text(),
-                index_file=self.index_edit.text() or "index.html"
+                index_file=self.index_edit.text() or DEFAULT_INDEX_FILE
             )
         except Exception as e:
             logger.error(f"Failed to create static config: {e}")
+            self._config_error = str(e)
             return None
     
-    def load_site(self, site_config: StaticSiteConfig):
-        """加载站点."""
-        self.original_site_name = site_config.site_name
-        
-        self.site_name_edit.setText(site_config.site_name)
-        self.port_spin.setValue(site_config.listen_port)
-        self.server_name_edit.setText(site_config.server_name)
-        self.https_check.setChecked(site_config.enable_https)
-        
-        if site_config.enable_https:
-            self.ssl_cert_edit.setText(site_config.ssl_cert_path or "")
-            self.ssl_key_edit.setText(site_config.ssl_key_path or "")
-        
+    def _form_widgets(self) -> list:
+        """返回所有会触发预览的表单控件."""
+        return super()._form_widgets() + [self.root_edit, self.index_edit]
+    
+    def _load_specific_fields(self, site_config: StaticSiteConfig):
+        """加载静态站点字段."""
         self.root_edit.setText(site_config.root_path)
         self.index_edit.setText(site_config.index_file)
-        
-        self._update_preview()
-    
-    def _browse_root(self):
-        """浏览根目录."""
-        directory = QFileDialog.getExistingDirectory(
-            self,
-            self.language_manager.get("select_root_dir"),
-            self.root_edit.text() or ""
-        )
-        if directory:
-            self.root_edit.setText(directory)
 
 
 class PHPSitePage(BaseConfigPage):
@@ -403,7 +629,7 @@ class PHPSitePage(BaseConfigPage):
         
         # Socket配置
         socket_layout = QHBoxLayout()
-        self.php_socket_edit = QLineEdit("/run/php/php-fpm.sock")
+        self.php_socket_edit = QLineEdit(DEFAULT_PHP_SOCKET)
         socket_layout.addWidget(self.php_socket_edit)
         php_layout.addLayout(socket_layout)
         
@@ -412,13 +638,13 @@ class PHPSitePage(BaseConfigPage):
         tcp_layout = QHBoxLayout(tcp_widget)
         tcp_layout.setContentsMargins(0, 0, 0, 0)
         
-        self.php_host_edit = QLineEdit("127.0.0.1")
+        self.php_host_edit = QLineEdit(DEFAULT_PHP_HOST)
         tcp_layout.addWidget(QLabel(self.language_manager.get("php_host")))
         tcp_layout.addWidget(self.php_host_edit)
         
         self.php_port_spin = QSpinBox()
         self.php_port_spin.setRange(1, 65535)
-        self.php_port_spin.setValue(9000)
+        self.php_port_spin.setValue(DEFAULT_PHP_PORT)
         tcp_layout.addWidget(QLabel(self.language_manager.get("php_port")))
         tcp_layout.addWidget(self.php_port_spin)
         
@@ -459,14 +685,15 @@ class PHPSitePage(BaseConfigPage):
         """获取PHP站点配置."""
         try:
             is_unix = self.php_mode_combo.currentIndex() == 0
+            https = self.https_check.isChecked()
             
             return PHPSiteConfig(
                 site_name=self.site_name_edit.text(),
                 listen_port=self.port_spin.value(),
                 server_name=self.server_name_edit.text(),
-                enable_https=self.https_check.isChecked(),
-                ssl_cert_path=self.ssl_cert_edit.text() if self.https_check.isChecked() else None,
-                ssl_key_path=self.ssl_key_edit.text() if self.https_check.isChecked() else None,
+                enable_https=https,
+                ssl_cert_path=self.ssl_cert_edit.text() if https else None,
+                ssl_key_path=self.ssl_key_edit.text() if https else None,
                 root_path=self.root_edit.text(),
                 php_fpm_mode="unix" if is_unix else "tcp",
                 php_fpm_socket=self.php_socket_edit.text() if is_unix else None,
@@ -475,43 +702,29 @@ class PHPSitePage(BaseConfigPage):
             )
         except Exception as e:
             logger.error(f"Failed to create PHP config: {e}")
+            self._config_error = str(e)
             return None
     
-    def load_site(self, site_config: PHPSiteConfig):
-        """加载站点."""
-        self.original_site_name = site_config.site_name
-        
-        self.site_name_edit.setText(site_config.site_name)
-        self.port_spin.setValue(site_config.listen_port)
-        self.server_name_edit.setText(site_config.server_name)
-        self.https_check.setChecked(site_config.enable_https)
-        
-        if site_config.enable_https:
-            self.ssl_cert_edit.setText(site_config.ssl_cert_path or "")
-            self.ssl_key_edit.setText(site_config.ssl_key_path or "")
-        
+    def _form_widgets(self) -> list:
+        """返回所有会触发预览的表单控件."""
+        return super()._form_widgets() + [
+            self.php_mode_combo, self.php_socket_edit, self.php_host_edit,
+            self.php_port_spin, self.root_edit
+        ]
+    
+    def _load_specific_fields(self, site_config: PHPSiteConfig):
+        """加载PHP站点字段."""
         self.root_edit.setText(site_config.root_path)
         
-        # PHP配置
+        # PHP配置（信号被阻断，需手动同步控件启用状态）
         if site_config.php_fpm_mode == "unix":
             self.php_mode_combo.setCurrentIndex(0)
-            self.php_socket_edit.setText(site_config.php_fpm_socket or "/run/php/php-fpm.sock")
+            self.php_socket_edit.setText(site_config.php_fpm_socket or DEFAULT_PHP_SOCKET)
         else:
             self.php_mode_combo.setCurrentIndex(1)
-            self.php_host_edit.setText(site_config.php_fpm_host or "127.0.0.1")
-            self.php_port_spin.setValue(site_config.php_fpm_port or 9000)
-        
-        self._update_preview()
-    
-    def _browse_root(self):
-        """浏览根目录."""
-        directory = QFileDialog.getExistingDirectory(
-            self,
-            self.language_manager.get("select_root_dir"),
-            self.root_edit.text() or ""
-        )
-        if directory:
-            self.root_edit.setText(directory)
+            self.php_host_edit.setText(site_config.php_fpm_host or DEFAULT_PHP_HOST)
+            self.php_port_spin.setValue(site_config.php_fpm_port or DEFAULT_PHP_PORT)
+        self._on_php_mode_changed(self.php_mode_combo.currentIndex())
 
 
 class ProxySitePage(BaseConfigPage):
@@ -530,11 +743,15 @@ class ProxySitePage(BaseConfigPage):
         # 后端地址
         self.proxy_url_edit = QLineEdit()
         self.proxy_url_edit.setPlaceholderText(self.language_manager.get("backend_placeholder"))
+        self.proxy_url_edit.setValidator(
+            QRegularExpressionValidator(QRegularExpression(PROXY_URL_PATTERN), self.proxy_url_edit)
+        )
+        self._validated_widgets.append(self.proxy_url_edit)
         proxy_layout.addRow(self.language_manager.get("backend_url"), self.proxy_url_edit)
         
         # 路径前缀
-        self.location_edit = QLineEdit("/")
-        self.location_edit.setPlaceholderText("/")
+        self.location_edit = QLineEdit(DEFAULT_LOCATION_PATH)
+        self.location_edit.setPlaceholderText(DEFAULT_LOCATION_PATH)
         proxy_layout.addRow(self.language_manager.get("location_path"), self.location_edit)
         
         # WebSocket支持
@@ -553,36 +770,31 @@ class ProxySitePage(BaseConfigPage):
     def get_config(self) -> ProxySiteConfig:
         """获取反向代理配置."""
         try:
+            https = self.https_check.isChecked()
             return ProxySiteConfig(
                 site_name=self.site_name_edit.text(),
                 listen_port=self.port_spin.value(),
                 server_name=self.server_name_edit.text(),
-                enable_https=self.https_check.isChecked(),
-                ssl_cert_path=self.ssl_cert_edit.text() if self.https_check.isChecked() else None,
-                ssl_key_path=self.ssl_key_edit.text() if self.https_check.isChecked() else None,
+                enable_https=https,
+                ssl_cert_path=self.ssl_cert_edit.text() if https else None,
+                ssl_key_path=self.ssl_key_edit.text() if https else None,
                 proxy_pass_url=self.proxy_url_edit.text(),
-                location_path=self.location_edit.text() or "/",
+                location_path=self.location_edit.text() or DEFAULT_LOCATION_PATH,
                 enable_websocket=self.websocket_check.isChecked()
             )
         except Exception as e:
             logger.error(f"Failed to create proxy config: {e}")
+            self._config_error = str(e)
             return None
     
-    def load_site(self, site_config: ProxySiteConfig):
-        """加载站点."""
-        self.original_site_name = site_config.site_name
-        
-        self.site_name_edit.setText(site_config.site_name)
-        self.port_spin.setValue(site_config.listen_port)
-        self.server_name_edit.setText(site_config.server_name)
-        self.https_check.setChecked(site_config.enable_https)
-        
-        if site_config.enable_https:
-            self.ssl_cert_edit.setText(site_config.ssl_cert_path or "")
-            self.ssl_key_edit.setText(site_config.ssl_key_path or "")
-        
+    def _form_widgets(self) -> list:
+        """返回所有会触发预览的表单控件."""
+        return super()._form_widgets() + [
+            self.proxy_url_edit, self.location_edit, self.websocket_check
+        ]
+    
+    def _load_specific_fields(self, site_config: ProxySiteConfig):
+        """加载反向代理字段."""
         self.proxy_url_edit.setText(site_config.proxy_pass_url)
         self.location_edit.setText(site_config.location_path)
-        self.websocket_check.setChecked(site_config.enable_websocket)
-        
-        self._update_preview()
\ No newline at end of file
+        self.websocket_check.setChecked(site_config.enable_websocket)
\ No newline at end of file
@@ -2,29 +2,98 @@
 
 import sys
 import os
+from functools import partial
+from operator import attrgetter
 from pathlib import Path
+from typing import Optional, Union
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QHBoxLayout, QVBoxLayout, 
     QMessageBox, QFileDialog, QDialog, QSystemTrayIcon, QMenu,
     QApplication
 )
-from PySide6.QtCore import Qt, Slot
-from PySide6.QtGui import QIcon, QAction, QPixmap, QPainter, QColor, QFont
+from PySide6.QtCore import Qt, Slot, QTimer
+from PySide6.QtGui import QIcon, QAction, QActionGroup, QPixmap, QPainter, QColor, QFont
 from loguru import logger
 from models.nginx_status import NginxStatus, SiteListItem
 from viewmodels.main_viewmodel import MainViewModel
 from views.site_list_widget import SiteListWidget
-from views.site_config_dialog import (
-    StaticSiteConfigDialog, PHPSiteConfigDialog, ProxySiteConfigDialog
-)
 from views.status_bar import StatusBar
+from views.takeover_dialog import NginxTakeoverDialog
+from utils.config_registry import ConfigRegistry
 from utils.theme_manager import ThemeManager
 from utils.language_manager import LanguageManager
-from services.config_generator import ConfigGenerator
 
 # Application version
 APP_VERSION = "v1.0"
 
+# Status updates arriving within this window (ms) are coalesced into one repaint (~60Hz)
+STATUS_COALESCE_MS = 16
+
+# Language switches within this window (ms) trigger a single retranslation
+RETRANSLATE_DEBOUNCE_MS = 50
+
+# Same-thread signal wiring: call slots directly and never connect the same slot twice
+_DIRECT_UNIQUE = Qt.DirectConnection | Qt.UniqueConnection
+
+# Menu bar layout: (menu key, items). Each item is
+# (translation key, handler attribute path, handler args, attribute to store the action as),
+# or None for a separator. Items of None mean the menu is populated dynamically.
+_MENU_SPEC = (
+    ("file_menu", (
+        ("takeover_nginx", "_on_set_nginx_path", (), None),
+        ("startup_on_boot", "_on_toggle_startup", (), "startup_action"),
+        None,
+        ("new_proxy", "_on_add_site", ("proxy",), None),
+        ("new_php", "_on_add_site", ("php",), None),
+        ("new_static", "_on_add_site", ("static",), None),
+        None,
+        ("exit", "close", (), None),
+    )),
+    ("operation_menu", (
+        ("start_nginx", "_control_nginx", ("start",), "start_action"),
+        ("stop_nginx", "_control_nginx", ("stop",), "stop_action"),
+        ("reload_config", "_control_nginx", ("reload",), "reload_action"),
+        None,
+        ("refresh_sites", "_on_refresh_sites", (), None),
+        None,
+        ("test_config", "main_viewmodel.test_config", (), None),
+        ("backup_config", "main_viewmodel.backup_config", (), None),
+    )),
+    ("language_menu", None),
+    ("help_menu", (
+        ("about", "_on_about", (), None),
+    )),
+)
+
+# Notice shown when double-clicking a site that easyNginx does not manage
+_NON_MANAGED_TITLE = "非管理站点"
+_TMPL_NON_MANAGED_EDIT = (
+    "站点 '{site}' 不是由easyNginx管理的，无法直接编辑。\n\n"
+    "您可以在nginx.conf中手动编辑此站点配置。"
+)
+
+# Fallback tray icon colors (#28a745 background, white glyph)
+_TRAY_BG = QColor(0x28, 0xa7, 0x45)
+_TRAY_FG = QColor(255, 255, 255)
+
+# Fallback tray icon glyph font, created on first use (QFont needs a live QApplication)
+_TRAY_FONT: Optional[QFont] = None
+
+
+def _get_tray_font() -> QFont:
+    """Return the shared tray glyph font."""
+    global _TRAY_FONT
+    if _TRAY_FONT is None:
+        _TRAY_FONT = QFont("Arial", 9, QFont.Bold)
+    return _TRAY_FONT
+
+# Site type -> config dialog class name in views.site_config_dialog (imported on first use)
+_DIALOG_CLASSES = {
+    "static": "StaticSiteConfigDialog",
+    "php": "PHPSiteConfigDialog",
+    "proxy": "ProxySiteConfigDialog",
+}
+
 
 class MainWindow(QMainWindow):
     """
@@ -37,17 +106,57 @@ class MainWindow(QMainWindow):
     4. 全局错误处理
     """
     
+    # Fallback tray icon, rasterized once and shared
+    _default_tray_icon: Optional[QIcon] = None
+    
     def __init__(self, main_viewmodel: MainViewModel):
         """Initialize main window."""
         super().__init__()
         self.main_viewmodel = main_viewmodel
         self.theme_manager = ThemeManager()
         self.language_manager = LanguageManager()
-        self.config_generator = ConfigGenerator()
         
-        # Store language menu actions for radio behavior
+        # Theme whose stylesheet is currently applied
+        self._applied_theme: Optional[str] = None
+        
+        # Language menu actions by language code (checked state handled by an exclusive QActionGroup)
         self.language_actions = {}
         
+        # Translatable menus/actions -> translation key, for in-place retranslation
+        self._translatable: list[tuple[Union[QMenu, QAction], str]] = []
+        
+        # Site config dialogs, built on first use and reused afterwards
+        self._dialog_cache: dict[str, QDialog] = {}
+        
+        # Coalesce bursts of status updates into one status bar refresh
+        self._pending_status: Optional[NginxStatus] = None
+        self._last_status_snapshot: Optional[dict] = None
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(STATUS_COALESCE_MS)
+        self._status_timer.timeout.connect(self._flush_status)
+        
+        # Config preview dialog, built on first use and reused afterwards
+        self._preview_dialog: Optional[QDialog] = None
+        
+        # Set once shutdown cleanup has started
+        self._closing = False
+        
+        # Exit confirmation box, built on first close request
+        self._exit_box: Optional[QMessageBox] = None
+        
+        # Debounce retranslation when the language is switched several times in a row
+        self._retranslate_timer = QTimer(self)
+        self._retranslate_timer.setSingleShot(True)
+        self._retranslate_timer.setInterval(RETRANSLATE_DEBOUNCE_MS)
+        self._retranslate_timer.timeout.connect(self._retranslate_ui)
+        
+        # Message boxes reused per icon type instead of constructed per event
+        self._message_boxes: dict[QMessageBox.Icon, QMessageBox] = {}
+        
+        # Non-blocking box for operation results and errors
+        self._info_box: Optional[QMessageBox] = None
+        
         # System tray icon
         self.tray_icon = None
         self.tray_menu = None
@@ -55,7 +164,9 @@ class MainWindow(QMainWindow):
         # Initialize UI
         self._setup_ui()
         self._connect_signals()
-        self._setup_system_tray()
+        
+        # 托盘图标在事件循环启动后再创建，不占用首次绘制前的时间
+        QTimer.singleShot(0, self._setup_system_tray)
         
         logger.info("MainWindow initialized")
     
@@ -65,154 +176,197 @@ class MainWindow(QMainWindow):
         self.setMinimumSize(800, 600)
         
         # 中央部件
-        central_widget = QWidget()
-        self.setCentralWidget(central_widget)
+        central_widget = QWidget(self)
         
-        # 主布局 - 只包含站点列表
-        main_layout = QHBoxLayout(central_widget)
+        # 主布局 - 只包含站点列表；子部件直接以central_widget为父，布局最后一次性安装
+        main_layout = QHBoxLayout()
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.setSpacing(0)
         
         # 站点列表（占据全部空间）
-        self.site_list_widget = SiteListWidget(self.main_viewmodel)
+        self.site_list_widget = SiteListWidget(self.main_viewmodel, central_widget)
         main_layout.addWidget(self.site_list_widget)
+        central_widget.setLayout(main_layout)
+        self.setCentralWidget(central_widget)
         
         # 底部状态栏
-        self.status_bar = StatusBar(self.main_viewmodel)
+        self.status_bar = StatusBar(self.main_viewmodel, self)
         self.setStatusBar(self.status_bar)
         
         # 创建菜单栏
         self._create_menu_bar()
         
-        # 应用初始主题
-        self._apply_theme(self.theme_manager.current_theme)
+        # 应用初始主题 - 推迟到首次绘制之后，避免启动时整棵部件树重新polish阻塞窗口出现
+        QTimer.singleShot(0, partial(self._apply_theme, self.theme_manager.current_theme))
     
     def _create_menu_bar(self):
-        """Create menu bar."""
-        menu_bar = self.menuBar()
-        
-        # File menu
-        file_menu = menu_bar.addMenu(self.language_manager.get("file_menu"))
-        
-        # Takeover Nginx directory
-        nginx_action = file_menu.addAction(self.language_manager.get("takeover_nginx"))
-        nginx_action.triggered.connect(self._on_set_nginx_path)
+        """Create menu bar from _MENU_SPEC."""
+        for menu_key, items in _MENU_SPEC:
+            menu = self._add_menu(menu_key)
+            
+            # Language menu is populated from SUPPORTED_LANGUAGES
+            if items is None:
+                self._populate_language_menu(menu)
+                continue
+            
+            for item in items:
+                if item is None:
+                    menu.addSeparator()
+                    continue
+                
+                key, handler, args, attr = item
+                action = self._add_action(menu, key)
+                slot = attrgetter(handler)(self)
+                action.triggered.connect(partial(slot, *args) if args else slot)
+                if attr:
+                    setattr(self, attr, action)
         
         # Startup on boot
-        self.startup_action = file_menu.addAction(self.language_manager.get("startup_on_boot"))
         self.startup_action.setCheckable(True)
         self.startup_action.setChecked(self._is_startup_enabled())
-        self.startup_action.triggered.connect(self._on_toggle_startup)
-        
-        file_menu.addSeparator()
-        
-        # New site actions
-        new_proxy_action = file_menu.addAction(self.language_manager.get("new_proxy"))
-        new_proxy_action.triggered.connect(self._on_add_proxy_site)
-        
-        new_php_action = file_menu.addAction(self.language_manager.get("new_php"))
-        new_php_action.triggered.connect(self._on_add_php_site)
-        
-        new_static_action = file_menu.addAction(self.language_manager.get("new_static"))
-        new_static_action.triggered.connect(self._on_add_static_site)
-        
-        file_menu.addSeparator()
-        
-        # Exit
-        exit_action = file_menu.addAction(self.language_manager.get("exit"))
-        exit_action.triggered.connect(self.close)
-        
-        # Operation menu
-        action_menu = menu_bar.addMenu(self.language_manager.get("operation_menu"))
-        
-        # Start/Stop/Reload
-        self.start_action = action_menu.addAction(self.language_manager.get("start_nginx"))
-        self.start_action.triggered.connect(lambda: self.main_viewmodel.control_nginx("start"))
-        
-        self.stop_action = action_menu.addAction(self.language_manager.get("stop_nginx"))
-        self.stop_action.triggered.connect(lambda: self.main_viewmodel.control_nginx("stop"))
-        
-        self.reload_action = action_menu.addAction(self.language_manager.get("reload_config"))
-        self.reload_action.triggered.connect(lambda: self.main_viewmodel.control_nginx("reload"))
-        
-        action_menu.addSeparator()
-        
-        # Refresh sites list from nginx.conf
-        refresh_action = action_menu.addAction(self.language_manager.get("refresh_sites"))
-        refresh_action.triggered.connect(self._on_refresh_sites)
-        
-        action_menu.addSeparator()
-        
-        # Test config
-        test_action = action_menu.addAction(self.language_manager.get("test_config"))
-        test_action.triggered.connect(self.main_viewmodel.test_config)
-        
-        # Backup
-        backup_action = action_menu.addAction(self.language_manager.get("backup_config"))
-        backup_action.triggered.connect(self.main_viewmodel.backup_config)
-        
-        # Language menu
-        lang_menu = menu_bar.addMenu(self.language_manager.get("language_menu"))
-        
+    
+    def _populate_language_menu(self, lang_menu: QMenu):
+        """Add one checkable action per supported language, in an exclusive group."""
+        current = self.language_manager.current_language
+        self._language_group = QActionGroup(self)
+        self._language_group.setExclusive(True)
         for lang_code, (display_name, native_name) in self.language_manager.SUPPORTED_LANGUAGES.items():
             action = lang_menu.addAction(native_name)
             action.setCheckable(True)
-            action.setChecked(lang_code == self.language_manager.current_language)
-            action.triggered.connect(lambda checked, l=lang_code: self._on_language_changed(l))
-            self.language_actions[lang_code] = action  # Store for radio behavior
-        
-        # Help menu
-        help_menu = menu_bar.addMenu(self.language_manager.get("help_menu"))
+            action.setChecked(lang_code == current)
+            action.setData(lang_code)
+            self._language_group.addAction(action)
+            self.language_actions[lang_code] = action
         
-        about_action = help_menu.addAction(self.language_manager.get("about"))
-        about_action.triggered.connect(self._on_about)
+        self._language_group.triggered.connect(self._on_language_action_triggered)
+    
+    def _add_menu(self, key: str) -> QMenu:
+        """Add a top-level menu and register it for retranslation."""
+        menu = self.menuBar().addMenu(self.language_manager.get(key))
+        self._translatable.append((menu, key))
+        return menu
+    
+    def _add_action(self, menu: QMenu, key: str) -> QAction:
+        """Add a menu action and register it for retranslation."""
+        action = menu.addAction(self.language_manager.get(key))
+        self._translatable.append((action, key))
+        return action
     
     def _connect_signals(self):
         """连接信号."""
-        # MainViewModel信号
-        self.main_viewmodel.nginx_status_changed.connect(self._on_nginx_status_changed)
-        self.main_viewmodel.site_list_changed.connect(self._on_site_list_changed)
-        self.main_viewmodel.operation_completed.connect(self._on_operation_completed)
-        self.main_viewmodel.error_occurred.connect(self._on_error_occurred)
-        self.main_viewmodel.config_generated.connect(self._on_config_generated)
-        
-        # UI信号
-        self.site_list_widget.site_selected.connect(self._on_site_selected)
-        self.site_list_widget.site_double_clicked.connect(self._on_site_selected)
-        self.site_list_widget.site_selected_with_item.connect(self._on_site_selected_with_item)
-        self.site_list_widget.delete_site.connect(self._on_delete_site)
+        # MainViewModel信号 - 均在GUI线程发出（状态线程的结果已先排队回到ViewModel），直接调用
+        self.main_viewmodel.nginx_status_changed.connect(self._on_nginx_status_changed, _DIRECT_UNIQUE)
+        self.main_viewmodel.site_list_changed.connect(self._on_site_list_changed, _DIRECT_UNIQUE)
+        self.main_viewmodel.operation_completed.connect(self._on_operation_completed, _DIRECT_UNIQUE)
+        self.main_viewmodel.error_occurred.connect(self._on_error_occurred, _DIRECT_UNIQUE)
+        self.main_viewmodel.config_generated.connect(self._on_config_generated, _DIRECT_UNIQUE)
+        
+        # UI信号 - 同在GUI线程，直接调用
+        self.site_list_widget.site_selected.connect(self._on_site_selected, _DIRECT_UNIQUE)
+        self.site_list_widget.site_double_clicked.connect(self._on_site_selected, _DIRECT_UNIQUE)
+        self.site_list_widget.site_selected_with_item.connect(self._on_site_selected_with_item, _DIRECT_UNIQUE)
+        self.site_list_widget.delete_site.connect(self._on_delete_site, _DIRECT_UNIQUE)
+        self.site_list_widget.delete_sites.connect(self._on_delete_sites, _DIRECT_UNIQUE)
+    
+    def _control_nginx(self, action: str, checked: bool = False):
+        """Menu/tray dispatcher for start/stop/reload (checked comes from QAction.triggered)."""
+        self.main_viewmodel.control_nginx(action)
+    
+    def _show_message(self, icon: QMessageBox.Icon, title: str, text: str,
+                      buttons=QMessageBox.Ok) -> QMessageBox.StandardButton:
+        """Show a modal message box, reusing the cached box for this icon type."""
+        box = self._message_boxes.get(icon)
+        if box is None or box.isVisible():
+            # A box of this type is already open (nested event loop); use a temporary one
+            box = QMessageBox(icon, title, text, buttons, self)
+            if icon in self._message_boxes:
+                box.setAttribute(Qt.WA_DeleteOnClose)
+            else:
+                self._message_boxes[icon] = box
+        else:
+            box.setWindowTitle(title)
+            box.setText(text)
+            box.setStandardButtons(buttons)
+        box.exec()
+        return box.standardButton(box.clickedButton())
+    
+    def _notify(self, icon: QMessageBox.Icon, title: str, text: str):
+        """Show a window-modal notification without blocking the event loop.
+        
+        The cached box is reused only when it is closed; a notification arriving while
+        it is still on screen gets its own box so the unread one is not overwritten.
+        """
+        box = self._info_box
+        if box is None or box.isVisible():
+            box = QMessageBox(icon, title, text, QMessageBox.Ok, self)
+            if self._info_box is None:
+                self._info_box = box
+            else:
+                box.setAttribute(Qt.WA_DeleteOnClose)
+        else:
+            box.setIcon(icon)
+            box.setWindowTitle(title)
+            box.setText(text)
+        box.open()
     
     @Slot(NginxStatus)
     def _on_nginx_status_changed(self, status):
-        """Nginx状态改变."""
-        self.status_bar.update_status(status)
+        """Nginx状态改变 - 只保留最新状态，由定时器统一刷新."""
+        # 除检查时间外与上次相同的状态不再刷新状态栏
+        snapshot = status.dict(exclude={"last_check_time"})
+        if snapshot == self._last_status_snapshot:
+            return
+        self._last_status_snapshot = snapshot
+        self._pending_status = status
+        self._status_timer.start()
+    
+    @Slot()
+    def _flush_status(self):
+        """将最新的Nginx状态刷新到状态栏."""
+        if self._pending_status is not None:
+            self.status_bar.update_status(self._pending_status)
+            self._pending_status = None
     
     @Slot(list)
     def _on_site_list_changed(self, site_items):
         """站点列表改变."""
-        self.site_list_widget.update_sites(site_items)
+        # 整表重建期间暂停重绘和信号，结束后统一刷新一次
+        widget = self.site_list_widget
+        widget.setUpdatesEnabled(False)
+        blocked = widget.blockSignals(True)
+        try:
+            widget.update_sites(site_items)
+        finally:
+            widget.blockSignals(blocked)
+            widget.setUpdatesEnabled(True)
     
     @Slot(bool, str)
     def _on_operation_completed(self, success, message):
         """操作完成."""
         if success:
-            QMessageBox.information(self, self.language_manager.get("operation_success"), message)
+            self._notify(QMessageBox.Information, self.language_manager.get("operation_success"), message)
         else:
-            QMessageBox.warning(self, self.language_manager.get("operation_failed"), message)
+            self._notify(QMessageBox.Warning, self.language_manager.get("operation_failed"), message)
     
     @Slot(str)
     def _on_error_occurred(self, error):
         """错误发生."""
-        QMessageBox.critical(self, self.language_manager.get("error"), error)
+        self._notify(QMessageBox.Critical, self.language_manager.get("error"), error)
         logger.error(f"UI error: {error}")
     
     @Slot(str)
     def _on_config_generated(self, config_content):
         """配置已生成."""
         # 显示预览对话框
-        from views.preview_dialog import ConfigPreviewDialog
-        dialog = ConfigPreviewDialog(self, config_content)
-        dialog.exec()
+        # 首次使用时创建，之后只替换内容
+        if self._preview_dialog is None:
+            from views.preview_dialog import ConfigPreviewDialog
+            self._preview_dialog = ConfigPreviewDialog(self, config_content)
+        else:
+            self._preview_dialog.set_content(config_content)
+        self._preview_dialog.show()
+        self._preview_dialog.raise_()
+        self._preview_dialog.activateWindow()
     
     @Slot(str)
     def _on_site_selected(self, site_name):
@@ -222,11 +376,10 @@ class MainWindow(QMainWindow):
             self._edit_site(site)
         else:
             # 非管理站点，提示用户
-            QMessageBox.information(
-                self,
-                "非管理站点",
-                f"站点 '{site_name}' 不是由easyNginx管理的，无法直接编辑。\n\n"
-                "您可以在nginx.conf中手动编辑此站点配置。"
+            self._notify(
+                QMessageBox.Information,
+                _NON_MANAGED_TITLE,
+                _TMPL_NON_MANAGED_EDIT.format(site=site_name)
             )
     
     @Slot(SiteListItem)
@@ -235,63 +388,58 @@ class MainWindow(QMainWindow):
         # 所有站点都可以直接编辑（移除非管理站点的限制）
         self._on_site_selected(site_item.site_name)
     
-    def _on_add_static_site(self):
-        """添加静态站点."""
-        dialog = StaticSiteConfigDialog(self.main_viewmodel, self, self.language_manager)
-        if dialog.exec() == QDialog.Accepted:
-            config = dialog.get_config()
-            if config:
-                self.main_viewmodel.add_site(config)
-    
-    def _on_add_php_site(self):
-        """添加PHP站点."""
-        dialog = PHPSiteConfigDialog(self.main_viewmodel, self, self.language_manager)
-        if dialog.exec() == QDialog.Accepted:
-            config = dialog.get_config()
-            if config:
-                self.main_viewmodel.add_site(config)
-    
-    def _on_add_proxy_site(self):
-        """添加代理站点."""
-        dialog = ProxySiteConfigDialog(self.main_viewmodel, self, self.language_manager)
-        if dialog.exec() == QDialog.Accepted:
-            config = dialog.get_config()
-            if config:
-                self.main_viewmodel.add_site(config)
+    def _on_add_site(self, site_type: str, checked: bool = False):
+        """添加站点（checked来自QAction.triggered）."""
+        self._open_site_dialog(site_type)
     
     @Slot(str)
     def _on_delete_site(self, site_name: str):
         """删除站点 - 直接调用ViewModel删除（确认已在site_list_widget中完成）"""
         self.main_viewmodel.delete_site(site_name)
     
+    @Slot(list)
+    def _on_delete_sites(self, site_names: list):
+        """批量删除站点 - 确认已在site_list_widget中完成，只部署一次."""
+        self.main_viewmodel.delete_sites(site_names)
+    
 
     
+    def _get_dialog(self, site_type: str) -> QDialog:
+        """Return the cached config dialog for site_type, creating it on first use."""
+        dialog = self._dialog_cache.get(site_type)
+        if dialog is None:
+            from views import site_config_dialog
+            dialog_class = getattr(site_config_dialog, _DIALOG_CLASSES[site_type])
+            dialog = dialog_class(self.main_viewmodel, self, self.language_manager)
+            self._dialog_cache[site_type] = dialog
+        return dialog
+    
     def _edit_site(self, site):
         """编辑站点."""
-        # 根据站点类型创建对应的对话框
-        if site.site_type == "static":
-            dialog = StaticSiteConfigDialog(self.main_viewmodel, self, self.language_manager)
-            dialog.load_site(site)
-            if dialog.exec() == QDialog.Accepted:
-                config = dialog.get_config()
-                if config:
-                    self.main_viewmodel.update_site(site.site_name, config)
-        elif site.site_type == "php":
-            dialog = PHPSiteConfigDialog(self.main_viewmodel, self, self.language_manager)
-            dialog.load_site(site)
-            if dialog.exec() == QDialog.Accepted:
-                config = dialog.get_config()
-                if config:
-                    self.main_viewmodel.update_site(site.site_name, config)
-        elif site.site_type == "proxy":
-            dialog = ProxySiteConfigDialog(self.main_viewmodel, self, self.language_manager)
+        # 未知类型的站点没有对应的对话框
+        if site.site_type in _DIALOG_CLASSES:
+            self._open_site_dialog(site.site_type, site)
+    
+    def _open_site_dialog(self, site_type: str, site=None):
+        """打开站点配置对话框；传入site时为编辑，否则为新建."""
+        dialog = self._get_dialog(site_type)
+        dialog.reset()
+        if site is not None:
             dialog.load_site(site)
-            if dialog.exec() == QDialog.Accepted:
-                config = dialog.get_config()
-                if config:
+        if dialog.exec() == QDialog.Accepted:
+            config = dialog.get_config()
+            if config:
+                if site is None:
+                    self.main_viewmodel.add_site(config)
+                else:
                     self.main_viewmodel.update_site(site.site_name, config)
     
-    def _on_language_changed(self, lang_code):
+    @Slot(QAction)
+    def _on_language_action_triggered(self, action: QAction):
+        """Language menu entry chosen; the exclusive group keeps the check state."""
+        self._on_language_changed(action.data())
+    
+    def _on_language_changed(self, lang_code: str):
         """Language changed - update UI without restart."""
         if lang_code == self.language_manager.current_language:
             return
@@ -299,58 +447,65 @@ class MainWindow(QMainWindow):
         # Update language manager
         self.language_manager.set_language(lang_code)
         
-        # Implement radio button behavior: uncheck other actions
-        for code, action in self.language_actions.items():
-            action.setChecked(code == lang_code)
-        
-        # Update all UI text dynamically
-        self._retranslate_ui()
+        # Update all UI text dynamically; rapid switches retranslate only once
+        self._retranslate_timer.start()
         
         logger.info(f"Language switched to {lang_code}")
     
     def _apply_theme(self, theme: str):
         """应用主题."""
+        # 主题未变化时跳过，避免整棵部件树无谓地重新polish
+        if theme == self._applied_theme:
+            return
+        self._applied_theme = theme
         self.setStyleSheet(self.theme_manager.get_theme_qss(theme))
         logger.info(f"Applied theme: {theme}")
     
+    @Slot()
     def _on_set_nginx_path(self):
         """接管Nginx目录."""
-        from utils.config_registry import ConfigRegistry
-        from views.takeover_dialog import NginxTakeoverDialog
-        
         dialog = NginxTakeoverDialog(self, "", self.language_manager)
+        accepted = dialog.exec() == QDialog.Accepted
+        nginx_path, config_path = dialog.get_nginx_paths()
+        dialog.deleteLater()
         
-        if dialog.exec() == QDialog.Accepted:
-            nginx_path, config_path = dialog.get_nginx_paths()
+        if accepted:
             
             if nginx_path and config_path:
                 # 更新注册表
                 config_registry = ConfigRegistry()
                 config_registry.set_nginx_paths(nginx_path, config_path)
-                config_registry.set_takeover_status(
-                    True,
-                    str(Path(nginx_path).parent),
-                    str(Path(config_path).parent / "backups")
-                )
+                nginx_dir = str(Path(nginx_path).parent)
+                backup_dir = str(Path(config_path).parent / "backups")
+                config_registry.set_takeover_status(True, nginx_dir, backup_dir)
                 
                 # 更新ViewModel
                 self.main_viewmodel.update_nginx_path(nginx_path, config_path)
-                QMessageBox.information(
-                    self,
-                    self.language_manager.get("takeover_completed"), 
-                    self.language_manager.get("takeover_restart_message") + "\n\n" + 
-                    self.language_manager.get("please_restart_application")
+                tr = self.language_manager.get
+                self._show_message(
+                    QMessageBox.Information,
+                    tr("takeover_completed"),
+                    tr("takeover_restart_message") + "\n\n" + tr("please_restart_application")
                 )
     
+    @Slot()
     def _retranslate_ui(self):
         """Dynamically update all UI text when language changes."""
         # Update window title
         self.setWindowTitle(f"easyNginx {APP_VERSION}")
         
-        # Recreate menu bar with new language
-        self.menuBar().clear()
-        self.language_actions.clear()
-        self._create_menu_bar()
+        # Retranslate menus and actions in place instead of rebuilding the menu bar
+        tr = self.language_manager.get
+        for widget, key in self._translatable:
+            (widget.setTitle if isinstance(widget, QMenu) else widget.setText)(tr(key))
+        
+        # Cached dialogs hold texts of the old language; rebuild them on next use
+        for dialog in self._dialog_cache.values():
+            dialog.deleteLater()
+        self._dialog_cache.clear()
+        if self._preview_dialog is not None:
+            self._preview_dialog.deleteLater()
+            self._preview_dialog = None
         
         # Update site list headers
         self.site_list_widget.update_headers()
@@ -367,68 +522,78 @@ class MainWindow(QMainWindow):
         # 创建托盘图标
         self.tray_icon = QSystemTrayIcon(self)
         
-        # 获取应用程序路径
-        if getattr(sys, 'frozen', False):
-            application_path = Path(sys._MEIPASS)
-        else:
-            application_path = Path(__file__).parent.parent
-        
-        # 尝试使用app.ico作为托盘图标
-        icon_path = application_path / "app.ico"
-        if icon_path.exists():
-            self.tray_icon.setIcon(QIcon(str(icon_path)))
-            logger.info(f"System tray icon set to: {icon_path}")
+        # 优先复用启动时已加载的应用图标（app.ico），避免再次读取和解码
+        app_icon = QApplication.windowIcon()
+        if not app_icon.isNull():
+            self.tray_icon.setIcon(app_icon)
         else:
-            # 回退到默认图标
-            logger.warning(f"app.ico not found at {icon_path}, using default icon")
-            pixmap = self._create_tray_icon_pixmap()
-            self.tray_icon.setIcon(QIcon(pixmap))
+            # 获取应用程序路径
+            if getattr(sys, 'frozen', False):
+                application_path = Path(sys._MEIPASS)
+            else:
+                application_path = Path(__file__).parent.parent
+            
+            # 尝试使用app.ico作为托盘图标
+            icon_path = application_path / "app.ico"
+            if icon_path.exists():
+                self.tray_icon.setIcon(QIcon(str(icon_path)))
+                logger.info(f"System tray icon set to: {icon_path}")
+            else:
+                # 回退到系统主题图标，没有时再使用绘制的默认图标
+                logger.warning(f"app.ico not found at {icon_path}, using default icon")
+                icon = QIcon.fromTheme("network-server")
+                self.tray_icon.setIcon(icon if not icon.isNull() else self._get_default_tray_icon())
         
-        # 创建托盘菜单
+        # 创建托盘菜单 - 菜单项在首次弹出时才创建
         self.tray_menu = QMenu()
+        self.tray_menu.aboutToShow.connect(self._populate_tray_menu)
+        
+        self.tray_icon.setContextMenu(self.tray_menu)
+        
+        # 双击托盘图标显示主窗口
+        self.tray_icon.activated.connect(self._on_tray_icon_activated)
+        
+        # 显示托盘图标
+        self.tray_icon.show()
+        
+        logger.info("System tray icon created")
+    
+    @Slot()
+    def _populate_tray_menu(self):
+        """首次弹出托盘菜单时创建菜单项."""
+        self.tray_menu.aboutToShow.disconnect(self._populate_tray_menu)
         
         # 显示/隐藏主窗口
-        show_action = QAction(self.language_manager.get("show_main_window"), self)
+        show_action = self._add_action(self.tray_menu, "show_main_window")
         show_action.triggered.connect(self._show_hide_main_window)
-        self.tray_menu.addAction(show_action)
         
         # 启动Nginx
-        start_action = QAction(self.language_manager.get("start_nginx"), self)
-        start_action.triggered.connect(lambda: self.main_viewmodel.control_nginx("start"))
-        self.tray_menu.addAction(start_action)
+        start_action = self._add_action(self.tray_menu, "start_nginx")
+        start_action.triggered.connect(partial(self._control_nginx, "start"))
         
         # 停止Nginx
-        stop_action = QAction(self.language_manager.get("stop_nginx"), self)
-        stop_action.triggered.connect(lambda: self.main_viewmodel.control_nginx("stop"))
-        self.tray_menu.addAction(stop_action)
+        stop_action = self._add_action(self.tray_menu, "stop_nginx")
+        stop_action.triggered.connect(partial(self._control_nginx, "stop"))
         
         # 重载Nginx
-        reload_action = QAction(self.language_manager.get("reload_config"), self)
-        reload_action.triggered.connect(lambda: self.main_viewmodel.control_nginx("reload"))
-        self.tray_menu.addAction(reload_action)
+        reload_action = self._add_action(self.tray_menu, "reload_config")
+        reload_action.triggered.connect(partial(self._control_nginx, "reload"))
         
         self.tray_menu.addSeparator()
         
         # 退出
-        quit_action = QAction(self.language_manager.get("exit"), self)
+        quit_action = self._add_action(self.tray_menu, "exit")
         quit_action.triggered.connect(self._quit_from_tray)
-        self.tray_menu.addAction(quit_action)
-        
-        self.tray_icon.setContextMenu(self.tray_menu)
-        
-        # 双击托盘图标显示主窗口
-        self.tray_icon.activated.connect(self._on_tray_icon_activated)
-        
-        # 显示托盘图标
-        self.tray_icon.show()
-        
-        logger.info("System tray icon created")
     
-    def _create_tray_icon_pixmap(self):
-        """创建托盘图标 - 直接创建而不是从tray_icon获取."""
-        return self._create_default_tray_icon()
+    @classmethod
+    def _get_default_tray_icon(cls) -> QIcon:
+        """获取默认托盘图标 - 首次使用时绘制，之后复用."""
+        if cls._default_tray_icon is None:
+            cls._default_tray_icon = QIcon(cls._create_default_tray_icon())
+        return cls._default_tray_icon
     
-    def _create_default_tray_icon(self):
+    @staticmethod
+    def _create_default_tray_icon() -> QPixmap:
         """创建默认托盘图标."""
         pixmap = QPixmap(16, 16)
         pixmap.fill(Qt.transparent)
@@ -437,20 +602,20 @@ class MainWindow(QMainWindow):
         painter.setRenderHint(QPainter.Antialiasing)
         
         # 绘制绿色背景圆形
-        painter.setBrush(QColor("#28a745"))
+        painter.setBrush(_TRAY_BG)
         painter.setPen(Qt.NoPen)
         painter.drawEllipse(1, 1, 14, 14)
         
         # 绘制白色"N"字母
-        painter.setPen(QColor("white"))
-        font = QFont("Arial", 9, QFont.Bold)
-        painter.setFont(font)
+        painter.setPen(_TRAY_FG)
+        painter.setFont(_get_tray_font())
         painter.drawText(pixmap.rect(), Qt.AlignCenter, "N")
         
         painter.end()
         
         return pixmap
     
+    @Slot()
     def _show_hide_main_window(self):
         """显示/隐藏主窗口."""
         if self.isVisible():
@@ -460,20 +625,23 @@ class MainWindow(QMainWindow):
             self.raise_()
             self.activateWindow()
     
+    @Slot(QSystemTrayIcon.ActivationReason)
     def _on_tray_icon_activated(self, reason):
         """托盘图标激活事件."""
         if reason == QSystemTrayIcon.DoubleClick:
             self._show_hide_main_window()
     
+    @Slot()
     def _quit_from_tray(self):
         """从托盘退出."""
         self.tray_icon.hide()
         self.close()
     
+    @Slot()
     def _on_about(self):
         """About dialog."""
-        about_text = self.language_manager.get("about_content")
-        QMessageBox.about(self, self.language_manager.get("about_title"), about_text)
+        tr = self.language_manager.get
+        QMessageBox.about(self, tr("about_title"), tr("about_content"))
     
     @Slot()
     def _on_refresh_sites(self):
@@ -532,7 +700,7 @@ class MainWindow(QMainWindow):
             logger.info("Startup enabled")
         except Exception as e:
             logger.error(f"Failed to enable startup: {e}")
-            QMessageBox.warning(self, "Error", f"Failed to enable startup: {e}")
+            self._show_message(QMessageBox.Warning, "Error", f"Failed to enable startup: {e}")
     
     def _disable_startup(self):
         """禁用开机启动."""
@@ -549,8 +717,9 @@ class MainWindow(QMainWindow):
             logger.info("Startup disabled")
         except Exception as e:
             logger.error(f"Failed to disable startup: {e}")
-            QMessageBox.warning(self, "Error", f"Failed to disable startup: {e}")
+            self._show_message(QMessageBox.Warning, "Error", f"Failed to disable startup: {e}")
     
+    @Slot(bool)
     def _on_toggle_startup(self, checked: bool):
         """处理开机启动菜单项的点击."""
         if checked:
@@ -565,17 +734,41 @@ class MainWindow(QMainWindow):
             self.hide()
             event.ignore()
         else:
-            reply = QMessageBox.question(
-                self,
-                self.language_manager.get("confirm_exit"),
-                self.language_manager.get("exit_confirm_message"),
-                QMessageBox.Yes | QMessageBox.No
-            )
-            
-            if reply == QMessageBox.Yes:
-                # 清理资源
-                self.main_viewmodel.cleanup()
-                logger.info("Application closing...")
-                event.accept()
-            else:
-                event.ignore()
\ No newline at end of file
+            # 非阻塞确认，结果在 _on_exit_confirm_finished 中处理
+            event.ignore()
+            if self._exit_box is None:
+                self._exit_box = QMessageBox(self)
+                self._exit_box.setIcon(QMessageBox.Question)
+                self._exit_box.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
+                self._exit_box.finished.connect(self._on_exit_confirm_finished)
+            elif self._exit_box.isVisible():
+                return  # Already asking
+            tr = self.language_manager.get
+            self._exit_box.setWindowTitle(tr("confirm_exit"))
+            self._exit_box.setText(tr("exit_confirm_message"))
+            self._exit_box.open()
+    
+    @Slot(int)
+    def _on_exit_confirm_finished(self, result: int):
+        """Hide the window and quit once the exit confirmation is accepted."""
+        box = self._exit_box
+        if box.standardButton(box.clickedButton()) != QMessageBox.Yes:
+            return
+        # 窗口先隐藏，下一轮事件循环再清理资源并退出
+        logger.info("Application closing...")
+        self.hide()
+        QTimer.singleShot(0, self._finalize_close)
+    
+    @Slot()
+    def _finalize_close(self):
+        """Clean up on the GUI thread, then quit."""
+        if self._closing:
+            return  # Already shutting down
+        self._closing = True
+        try:
+            self.main_viewmodel.cleanup()
+        except Exception as e:
+            logger.error(f"Cleanup failed: {e}")
+        # 日志由后台线程写出（enqueue=True），退出前等待队列写完
+        logger.complete()
+        QApplication.quit()
\ No newline at end of file
@@ -1,11 +1,11 @@
 """Configuration preview dialog."""
 
 from PySide6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QTextEdit, 
+    QDialog, QVBoxLayout, QHBoxLayout, QPlainTextEdit, 
     QPushButton, QLabel, QFrame
 )
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont
+from PySide6.QtGui import QFontDatabase, QGuiApplication
 from utils.language_manager import LanguageManager
 
 
@@ -49,9 +49,10 @@ class ConfigPreviewDialog(QDialog):
         layout.addWidget(line)
         
         # 配置文本区域
-        self.config_edit = QTextEdit()
+        self.config_edit = QPlainTextEdit()
         self.config_edit.setReadOnly(True)
-        self.config_edit.setFont(QFont("Courier New", 10))
+        self.config_edit.setUndoRedoEnabled(False)  # 只读预览不需要撤销栈
+        self.config_edit.setFont(QFontDatabase.systemFont(QFontDatabase.FixedFont))
         self.config_edit.setPlainText(self.config_content)
         layout.addWidget(self.config_edit)
         
@@ -73,6 +74,12 @@ class ConfigPreviewDialog(QDialog):
         # 语法高亮
         self._apply_syntax_highlight()
     
+    def set_content(self, config_content: str):
+        """更新显示的配置内容（复用已有对话框）."""
+        self.config_content = config_content
+        self.config_edit.setPlainText(config_content)
+        self.copy_btn.setText(self.language_manager.get("copy_config"))
+    
     def _apply_syntax_highlight(self):
         """应用语法高亮."""
         # 在这里可以实现简单的语法高亮
@@ -81,8 +88,7 @@ class ConfigPreviewDialog(QDialog):
     
     def _copy_config(self):
         """复制配置到剪贴板."""
-        self.config_edit.selectAll()
-        self.config_edit.copy()
+        QGuiApplication.clipboard().setText(self.config_content)
         self.copy_btn.setText(self.language_manager.get("copied"))
         
     def showEvent(self, event):
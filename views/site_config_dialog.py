@@ -30,6 +30,8 @@ class BaseSiteConfigDialog(QDialog):
         
         self._setup_ui()
         self._connect_signals()
+        # 表单默认值统一由 _clear_fields 设置，reset() 复用同一份
+        self._clear_fields()
         
     def _setup_ui(self):
         """设置UI."""
@@ -85,7 +87,6 @@ class BaseSiteConfigDialog(QDialog):
         port_layout = QHBoxLayout()
         self.port_spin = QSpinBox()
         self.port_spin.setRange(1, 65535)
-        self.port_spin.setValue(80)
         port_layout.addWidget(self.port_spin)
         port_layout.addStretch()
         common_layout.addRow(self.language_manager.get("listen_port") + ":", port_layout)
@@ -116,18 +117,15 @@ class BaseSiteConfigDialog(QDialog):
         # 80端口重定向到HTTPS
         self.http_redirect_check = QCheckBox(self.language_manager.get("enable_http_redirect"))
         self.http_redirect_check.setToolTip(self.language_manager.get("http_redirect_tooltip"))
-        self.http_redirect_check.setEnabled(False)  # 默认禁用，只有在启用HTTPS时才可用
         https_layout.addWidget(self.http_redirect_check)
         
         # SSL证书路径
         cert_layout = QHBoxLayout()
         self.ssl_cert_edit = QLineEdit()
         self.ssl_cert_edit.setPlaceholderText(self.language_manager.get("ssl_cert_placeholder"))
-        self.ssl_cert_edit.setEnabled(False)
         cert_layout.addWidget(self.ssl_cert_edit)
         
         self.cert_browse_btn = QPushButton(self.language_manager.get("browse"))
-        self.cert_browse_btn.setEnabled(False)
         self.cert_browse_btn.clicked.connect(self._browse_cert)
         cert_layout.addWidget(self.cert_browse_btn)
         https_layout.addLayout(cert_layout)
@@ -136,11 +134,9 @@ class BaseSiteConfigDialog(QDialog):
         key_layout = QHBoxLayout()
         self.ssl_key_edit = QLineEdit()
         self.ssl_key_edit.setPlaceholderText(self.language_manager.get("ssl_key_placeholder"))
-        self.ssl_key_edit.setEnabled(False)
         key_layout.addWidget(self.ssl_key_edit)
         
         self.key_browse_btn = QPushButton(self.language_manager.get("browse"))
-        self.key_browse_btn.setEnabled(False)
         self.key_browse_btn.clicked.connect(self._browse_key)
         key_layout.addWidget(self.key_browse_btn)
         https_layout.addLayout(key_layout)
@@ -179,6 +175,10 @@ class BaseSiteConfigDialog(QDialog):
         self._update_title_for_mode()
         self._update_title_for_mode()
         
+    def reset(self):
+        """重置为新建状态（对话框被缓存复用时调用）."""
+        self.new_site()
+    
     def is_editing(self) -> bool:
         """是否在编辑模式."""
         return bool(self.original_site_name)
@@ -252,13 +252,14 @@ class BaseSiteConfigDialog(QDialog):
             )
     
     def _clear_fields(self):
-        """清空表单."""
+        """恢复表单默认值（构造时与reset()共用）."""
         self.site_name_edit.clear()
-        self.port_spin.setValue(80)
-        self.server_name_edit.setText("localhost")
+        self.server_name_edit.clear()
         self.https_check.setChecked(False)
         self.ssl_cert_edit.clear()
         self.ssl_key_edit.clear()
+        # 同步HTTPS相关控件：端口80，证书/私钥及80端口重定向取消并禁用
+        self._on_https_toggled(self.https_check.checkState())
     
     def _generate_unique_site_name(self, prefix: str) -> str:
         """
@@ -312,7 +313,7 @@ class StaticSiteConfigDialog(BaseSiteConfigDialog):
         specific_layout.addRow(self.language_manager.get("root_dir"), root_layout)
         
         # 索引文件
-        self.index_edit = QLineEdit("index.html")
+        self.index_edit = QLineEdit()
         self.index_edit.setPlaceholderText(self.language_manager.get("index_placeholder"))
         specific_layout.addRow(self.language_manager.get("index_file"), self.index_edit)
         
@@ -363,6 +364,12 @@ class StaticSiteConfigDialog(BaseSiteConfigDialog):
         # 加载后更新标题为编辑模式
         self._update_title_for_mode()
     
+    def _clear_fields(self):
+        """清空表单."""
+        super()._clear_fields()
+        self.root_edit.clear()
+        self.index_edit.setText("index.html")
+    
     def _update_title_for_mode(self):
         """根据模式（新建/编辑）更新标题."""
         if self.is_editing():
@@ -408,13 +415,12 @@ class PHPSiteConfigDialog(BaseSiteConfigDialog):
             tcp_layout = QHBoxLayout(tcp_widget)
             tcp_layout.setContentsMargins(0, 0, 0, 0)
             
-            self.php_host_edit = QLineEdit("127.0.0.1")
+            self.php_host_edit = QLineEdit()
             tcp_layout.addWidget(QLabel(self.language_manager.get("php_host")))
             tcp_layout.addWidget(self.php_host_edit)
             
             self.php_port_spin = QSpinBox()
             self.php_port_spin.setRange(1, 65535)
-            self.php_port_spin.setValue(9000)
             tcp_layout.addWidget(QLabel(self.language_manager.get("php_port")))
             tcp_layout.addWidget(self.php_port_spin)
             
@@ -432,7 +438,7 @@ class PHPSiteConfigDialog(BaseSiteConfigDialog):
             
             # Socket配置
             socket_layout = QHBoxLayout()
-            self.php_socket_edit = QLineEdit("/run/php/php-fpm.sock")
+            self.php_socket_edit = QLineEdit()
             socket_layout.addWidget(self.php_socket_edit)
             php_layout.addLayout(socket_layout)
             
@@ -441,13 +447,12 @@ class PHPSiteConfigDialog(BaseSiteConfigDialog):
             tcp_layout = QHBoxLayout(tcp_widget)
             tcp_layout.setContentsMargins(0, 0, 0, 0)
             
-            self.php_host_edit = QLineEdit("127.0.0.1")
+            self.php_host_edit = QLineEdit()
             tcp_layout.addWidget(QLabel(self.language_manager.get("php_host")))
             tcp_layout.addWidget(self.php_host_edit)
             
             self.php_port_spin = QSpinBox()
             self.php_port_spin.setRange(1, 65535)
-            self.php_port_spin.setValue(9000)
             tcp_layout.addWidget(QLabel(self.language_manager.get("php_port")))
             tcp_layout.addWidget(self.php_port_spin)
             
@@ -550,6 +555,17 @@ class PHPSiteConfigDialog(BaseSiteConfigDialog):
         # 加载后更新标题为编辑模式
         self._update_title_for_mode()
     
+    def _clear_fields(self):
+        """清空表单."""
+        super()._clear_fields()
+        self.root_edit.clear()
+        self.php_host_edit.setText("127.0.0.1")
+        self.php_port_spin.setValue(9000)
+        if platform.system() != "Windows":
+            self.php_mode_combo.setCurrentIndex(0)
+            self.php_socket_edit.setText("/run/php/php-fpm.sock")
+            self._on_php_mode_changed(0)
+    
     def _update_title_for_mode(self):
         """根据模式（新建/编辑）更新标题."""
         if self.is_editing():
@@ -589,7 +605,7 @@ class ProxySiteConfigDialog(BaseSiteConfigDialog):
         proxy_layout.addRow(self.language_manager.get("backend_url"), self.proxy_url_edit)
         
         # 路径前缀
-        self.location_edit = QLineEdit("/")
+        self.location_edit = QLineEdit()
         self.location_edit.setPlaceholderText(self.language_manager.get("location_placeholder"))
         proxy_layout.addRow(self.language_manager.get("location_path"), self.location_edit)
         
@@ -647,6 +663,13 @@ class ProxySiteConfigDialog(BaseSiteConfigDialog):
         # 加载后更新标题为编辑模式
         self._update_title_for_mode()
     
+    def _clear_fields(self):
+        """清空表单."""
+        super()._clear_fields()
+        self.proxy_url_edit.clear()
+        self.location_edit.setText("/")
+        self.websocket_check.setChecked(False)
+    
     def _update_title_for_mode(self):
         """根据模式（新建/编辑）更新标题."""
         if self.is_editing():
@@ -1,16 +1,164 @@
 """Site list widget for displaying and managing sites."""
 
+from collections import Counter
+from typing import Optional
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QTableView, QLineEdit,
     QPushButton, QLabel, QHeaderView, QAbstractItemView, QMessageBox,
     QMenu
 )
-from PySide6.QtCore import Qt, Signal, QSize, Slot
-from PySide6.QtGui import QAction, QStandardItemModel, QStandardItem
+from PySide6.QtCore import (
+    Qt, Signal, QSize, QPoint, Slot, QAbstractTableModel, QModelIndex,
+    QItemSelection, QItemSelectionModel
+)
+from PySide6.QtGui import QAction
 from loguru import logger
 from models.nginx_status import SiteListItem
 from utils.language_manager import LanguageManager
 
+# Translation keys of the translated table columns, in column order
+HEADER_KEYS = ("site", "type", "port", "domain")
+
+# Translation keys of texts shown inside table cells
+CELL_TEXT_KEYS = ("static_site", "php_site", "proxy_site", "yes", "no", "redirect")
+MENU_TEXT_KEYS = ("edit", "delete")
+
+
+def _row_key(item: SiteListItem) -> tuple:
+    """站点行中影响显示的字段."""
+    return (item.site_type, item.listen_port, item.server_name, item.enable_https, item.enable_http_redirect)
+
+
+def _row_ranges(rows: list[int]) -> list[tuple[int, int]]:
+    """把升序的行号合并为连续区间 [(first, last), ...]."""
+    ranges = []
+    for row in rows:
+        if ranges and ranges[-1][1] == row - 1:
+            ranges[-1] = (ranges[-1][0], row)
+        else:
+            ranges.append((row, row))
+    return ranges
+
+
+class SiteTableModel(QAbstractTableModel):
+    """
+    站点表格模型
+    
+    直接从SiteListItem列表读取单元格数据，不为每个单元格创建QStandardItem
+    """
+    
+    COLUMN_COUNT = 5  # 站点、类型、端口、域名、HTTPS
+    CENTERED_COLUMNS = (2, 4)  # 端口、HTTPS
+    HANDLED_ROLES = frozenset((Qt.DisplayRole, Qt.UserRole, Qt.TextAlignmentRole))
+    
+    def __init__(self, parent=None):
+        """初始化表格模型."""
+        super().__init__(parent)
+        self._items: list[SiteListItem] = []
+        self._display_names: list[str] = []  # 与_items并行，set_items时预先计算
+        self._headers: list[str] = []
+        self._texts: dict[str, str] = {}
+        self._type_map: dict[str, str] = {}
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        """行数."""
+        return 0 if parent.isValid() else len(self._items)
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        """列数."""
+        return 0 if parent.isValid() else self.COLUMN_COUNT
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """表头文本."""
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and section < len(self._headers):
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        """单元格数据."""
+        # 视图会为每个可见单元格查询多种角色，未处理的角色直接返回
+        if role not in self.HANDLED_ROLES or not index.isValid():
+            return None
+        
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter if index.column() in self.CENTERED_COLUMNS else None
+        item = self._items[index.row()]
+        if role == Qt.DisplayRole:
+            return self._display_text(item, index.row(), index.column())
+        return item.site_name  # UserRole: original name
+    
+    def _display_text(self, item: SiteListItem, row: int, column: int) -> str:
+        """计算单元格显示的文本."""
+        if column == 0:
+            return self._display_names[row]  # 移除管理状态图标，统一显示
+        if column == 1:
+            return self._type_map.get(item.site_type, item.site_type)
+        if column == 2:
+            if item.enable_https and item.enable_http_redirect:
+                # 显示HTTPS端口和80重定向（格式：443/80(重定向)）
+                return f"{item.listen_port}/80({self._texts['redirect']})"
+            return str(item.listen_port)
+        if column == 3:
+            return item.server_name
+        return self._texts["yes"] if item.enable_https else self._texts["no"]
+    
+    def site_at(self, row: int) -> SiteListItem:
+        """获取指定行的站点."""
+        return self._items[row]
+    
+    def set_items(self, items: list[SiteListItem]):
+        """替换站点列表 - 只对增删的行做插入/删除，只通知内容变化的行."""
+        old_names = [item.site_name for item in self._items]
+        new_names = [item.site_name for item in items]
+        old_set, new_set = set(old_names), set(new_names)
+        if (len(old_set) != len(old_names) or len(new_set) != len(new_names)
+                or [n for n in old_names if n in new_set] != [n for n in new_names if n in old_set]):
+            # 有重名或保留的行顺序变化时整体重置
+            self.beginResetModel()
+            self._items = list(items)
+            self._display_names = [item.get_display_name() for item in items]
+            self.endResetModel()
+            return
+        
+        # 删除已不存在的行（自底向上，连续的行一次删除）
+        removed = [row for row, name in enumerate(old_names) if name not in new_set]
+        for first, last in reversed(_row_ranges(removed)):
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self._items[first:last + 1]
+            del self._display_names[first:last + 1]
+            self.endRemoveRows()
+        
+        # 按最终位置插入新增的行
+        added = [row for row, name in enumerate(new_names) if name not in old_set]
+        for first, last in _row_ranges(added):
+            self.beginInsertRows(QModelIndex(), first, last)
+            self._items[first:first] = items[first:last + 1]
+            self._display_names[first:first] = [item.get_display_name() for item in items[first:last + 1]]
+            self.endInsertRows()
+        
+        # 原有的行只在显示内容变化时通知视图
+        for row, item in enumerate(items):
+            old = self._items[row]
+            if old is item:
+                continue
+            self._items[row] = item
+            if _row_key(old) != _row_key(item):
+                self._display_names[row] = item.get_display_name()
+                self.dataChanged.emit(self.index(row, 0), self.index(row, self.COLUMN_COUNT - 1))
+    
+    def set_texts(self, headers: list[str], texts: dict[str, str]):
+        """设置表头和单元格中的翻译文本."""
+        self._headers = headers
+        self._texts = texts
+        self._type_map = {"static": texts["static_site"], "php": texts["php_site"], "proxy": texts["proxy_site"]}
+        self.headerDataChanged.emit(Qt.Horizontal, 0, self.COLUMN_COUNT - 1)
+        self._emit_all_changed()
+    
+    def _emit_all_changed(self):
+        """通知视图所有单元格已变化."""
+        if self._items:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self._items) - 1, self.COLUMN_COUNT - 1))
+
 
 class SiteListWidget(QWidget):
     """
@@ -27,13 +175,17 @@ class SiteListWidget(QWidget):
     add_php_site = Signal()
     add_proxy_site = Signal()
     delete_site = Signal(str)
+    delete_sites = Signal(list)  # 批量删除，传递站点名称列表
     
-    def __init__(self, main_viewmodel):
+    def __init__(self, main_viewmodel, parent=None):
         """初始化站点列表部件."""
-        super().__init__()
+        super().__init__(parent)
         self.main_viewmodel = main_viewmodel
         self.language_manager = LanguageManager()
         self.site_items: list[SiteListItem] = []
+        self._context_item: Optional[SiteListItem] = None  # 右键菜单对应的站点
+        self._context_selected_names: list[str] = []
+        self._last_signature: Optional[tuple] = None
         
         self._setup_ui()
         self._connect_signals()
@@ -50,7 +202,7 @@ class SiteListWidget(QWidget):
         self.site_table = QTableView()
         self.site_table.setAlternatingRowColors(True)
         self.site_table.setSelectionBehavior(QAbstractItemView.SelectRows)
-        self.site_table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.site_table.setSelectionMode(QAbstractItemView.ExtendedSelection)
         self.site_table.setEditTriggers(QAbstractItemView.NoEditTriggers)  # 禁用编辑
         self.site_table.setFocusPolicy(Qt.NoFocus)  # 去掉焦点框
         self.site_table.horizontalHeader().setStretchLastSection(True)
@@ -58,16 +210,24 @@ class SiteListWidget(QWidget):
         self.site_table.setContextMenuPolicy(Qt.CustomContextMenu)
         self.site_table.customContextMenuRequested.connect(self._show_context_menu)
         
+        # 固定行高，避免绘制时逐行查询sizeHint
+        vertical_header = self.site_table.verticalHeader()
+        vertical_header.setSectionResizeMode(QHeaderView.Fixed)
+        vertical_header.setDefaultSectionSize(28)  # Row height
+        
+        # 右键菜单只创建一次，显示前更新目标站点
+        self._context_menu = QMenu(self.site_table)  # 指定父部件为 site_table
+        self._edit_action = QAction(self)
+        self._edit_action.triggered.connect(self._on_context_edit)
+        self._context_menu.addAction(self._edit_action)
+        self._context_menu.addSeparator()
+        self._delete_action = QAction(self)
+        self._delete_action.triggered.connect(self._on_context_delete)
+        self._context_menu.addAction(self._delete_action)
+        
         # Set up model with translated headers
-        self.model = QStandardItemModel()
-        headers = [
-            self.main_viewmodel.language_manager.get("site"),
-            self.main_viewmodel.language_manager.get("type"),
-            self.main_viewmodel.language_manager.get("port"),
-            self.main_viewmodel.language_manager.get("domain"),
-            "HTTPS"
-        ]
-        self.model.setHorizontalHeaderLabels(headers)
+        self.model = SiteTableModel(self)
+        self._apply_texts()
         self.site_table.setModel(self.model)
         
         layout.addWidget(self.site_table)
@@ -78,8 +238,7 @@ class SiteListWidget(QWidget):
     
     def _connect_signals(self):
         """连接信号."""
-        # ViewModel信号
-        self.main_viewmodel.site_list_changed.connect(self.update_sites)
+        # ViewModel的site_list_changed由MainWindow转发到update_sites，这里不再重复连接
         
         # UI信号
         self.site_table.selectionModel().selectionChanged.connect(self._on_selection_changed)
@@ -87,140 +246,84 @@ class SiteListWidget(QWidget):
     
     def update_headers(self):
         """Update table headers with current language."""
-        headers = [
-            self.main_viewmodel.language_manager.get("site"),
-            self.main_viewmodel.language_manager.get("type"),
-            self.main_viewmodel.language_manager.get("port"),
-            self.main_viewmodel.language_manager.get("domain"),
-            "HTTPS"
-        ]
-        self.model.setHorizontalHeaderLabels(headers)
-        
-        # 刷新表格内容以更新语言相关的文本（如yes/no）
-        self._refresh_table()
+        # 同时更新表格中语言相关的文本（如yes/no）
+        self._apply_texts()
     
+    def _apply_texts(self):
+        """Pass translated header and cell texts to the model."""
+        get_many = self.main_viewmodel.language_manager.get_many
+        headers = get_many(HEADER_KEYS)
+        self.model.set_texts([headers[key] for key in HEADER_KEYS] + ["HTTPS"], get_many(CELL_TEXT_KEYS))
+        menu_texts = get_many(MENU_TEXT_KEYS)
+        self._edit_action.setText(menu_texts["edit"])
+        self._delete_action.setText(menu_texts["delete"])
+    
+    @Slot(QPoint)
     def _show_context_menu(self, position):
         """Show context menu."""
         index = self.site_table.indexAt(position)
         if index.isValid():
-            site_name = self.model.item(index.row(), 0).data(Qt.UserRole)
-            
-            # 查找对应的 SiteListItem 对象
-            site_item = next((item for item in self.site_items if item.site_name == site_name), None)
-            
-            # 创建菜单
-            menu = QMenu(self.site_table)  # 指定父部件为 site_table
-            
-            # 添加编辑菜单项
-            edit_action = QAction(self.main_viewmodel.language_manager.get("edit"), self)
-            edit_action.triggered.connect(lambda: self._edit_site(site_name))
-            menu.addAction(edit_action)
-            
-            # 添加分隔符
-            menu.addSeparator()
-            
-            # 添加删除菜单项
-            delete_action = QAction(self.main_viewmodel.language_manager.get("delete"), self)
-            if site_item:
-                delete_action.triggered.connect(lambda: self._confirm_delete(site_item))
-            else:
-                delete_action.triggered.connect(lambda: self._confirm_delete_site_name(site_name))
-            menu.addAction(delete_action)
-            
-            # 显示菜单
-            menu.exec(self.site_table.viewport().mapToGlobal(position))
+            self._context_item = self.model.site_at(index.row())
+            self._context_selected_names = self._selected_site_names()
+            self._context_menu.exec(self.site_table.viewport().mapToGlobal(position))
+    
+    @Slot()
+    def _on_context_edit(self):
+        """右键菜单 - 编辑."""
+        if self._context_item is not None:
+            self._edit_site(self._context_item.site_name)
+    
+    @Slot()
+    def _on_context_delete(self):
+        """右键菜单 - 删除."""
+        site_item = self._context_item
+        if site_item is None:
+            return
+        selected_names = self._context_selected_names
+        if len(selected_names) > 1 and site_item.site_name in selected_names:
+            # 右键位于多选范围内时一次确认删除全部选中站点
+            self._confirm_delete_site_names(selected_names)
+        else:
+            self._confirm_delete(site_item)
     
     @Slot(list)
     def update_sites(self, site_items: list[SiteListItem]):
         """Update site list."""
+        # 列表内容与上次相同时（如轮询重复推送）跳过整个刷新
+        signature = tuple((item.site_name, item.is_managed) + _row_key(item) for item in site_items)
+        if signature == self._last_signature:
+            return
+        self._last_signature = signature
+        
         self.site_items = site_items
-        self._refresh_table()
+        selected_names = self._selected_site_names()
+        self.model.set_items(site_items)
+        if selected_names and not self.site_table.selectionModel().hasSelection():
+            # 模型整体重置会清空选择，按站点名称恢复
+            self._restore_selection(selected_names)
         
         # Update statistics
-        total = len(site_items)
-        static_count = sum(1 for item in site_items if item.site_type == "static")
-        php_count = sum(1 for item in site_items if item.site_type == "php")
-        proxy_count = sum(1 for item in site_items if item.site_type == "proxy")
-        
-        self.status_label.setText(
-            self.main_viewmodel.language_manager.get("total_sites", 
-                total=total, static=static_count, php=php_count, proxy=proxy_count
-            )
+        counts = Counter(item.site_type for item in site_items)
+        
+        stats_text = self.main_viewmodel.language_manager.get("total_sites", 
+            total=len(site_items), static=counts["static"], php=counts["php"], proxy=counts["proxy"]
         )
+        if stats_text != self.status_label.text():
+            self.status_label.setText(stats_text)
     
-    def _refresh_table(self):
-        """Refresh table - 所有站点统一显示，不再区分管理/非管理."""
-        # Get translations
-        static_text = self.main_viewmodel.language_manager.get("static_site")
-        php_text = self.main_viewmodel.language_manager.get("php_site")
-        proxy_text = self.main_viewmodel.language_manager.get("proxy_site")
-        yes_text = self.main_viewmodel.language_manager.get("yes")
-        no_text = self.main_viewmodel.language_manager.get("no")
-        
-        self.model.setRowCount(0)
-        
-        for item in self.site_items:
-            row = []
-            
-            # Site name (移除管理状态图标，统一显示)
-            name_item = QStandardItem()
-            display_name = item.get_display_name()
-            name_item.setText(display_name)
-            name_item.setData(item.site_name, Qt.UserRole)  # Store original name
-            row.append(name_item)
-            
-            # Type
-            type_item = QStandardItem()
-            type_map = {"static": static_text, "php": php_text, "proxy": proxy_text}
-            type_name = type_map.get(item.site_type, item.site_type)
-            type_item.setText(type_name)
-            row.append(type_item)
-            
-            # Port
-            port_item = QStandardItem()
-            if item.enable_https and item.enable_http_redirect:
-                # 显示HTTPS端口和80重定向（格式：443/80(重定向)）
-                redirect_text = self.main_viewmodel.language_manager.get("redirect")
-                port_display = f"{item.listen_port}/80({redirect_text})"
-                port_item.setText(port_display)
-            else:
-                port_item.setText(str(item.listen_port))
-            port_item.setTextAlignment(Qt.AlignCenter)
-            row.append(port_item)
-            
-            # Domain
-            domain_item = QStandardItem()
-            domain_item.setText(item.server_name)
-            row.append(domain_item)
-            
-            # HTTPS
-            https_item = QStandardItem()
-            https_item.setText(yes_text if item.enable_https else no_text)
-            https_item.setTextAlignment(Qt.AlignCenter)
-            row.append(https_item)
-            
-            self.model.appendRow(row)
-        
-        # Set row height
-        self.site_table.verticalHeader().setDefaultSectionSize(28)
-    
+    @Slot()
     def _on_selection_changed(self):
         """选择改变."""
         selected = self.site_table.selectionModel().currentIndex()
         if selected.isValid():
-            site_name = self.model.item(selected.row(), 0).data(Qt.UserRole)
+            site_name = self.model.site_at(selected.row()).site_name
             logger.debug(f"Site selected: {site_name}")
     
+    @Slot(QModelIndex)
     def _on_double_clicked(self, index):
         """双击."""
         if index.isValid():
-            site_name = self.model.item(index.row(), 0).data(Qt.UserRole)
-            # 查找完整的SiteListItem
-            site_item = next((item for item in self.site_items if item.site_name == site_name), None)
-            if site_item:
-                self.site_selected_with_item.emit(site_item)
-            else:
-                self.site_selected.emit(site_name)
+            self.site_selected_with_item.emit(self.model.site_at(index.row()))
     
     def _edit_site(self, site_name: str):
         """编辑站点."""
@@ -239,15 +342,36 @@ class SiteListWidget(QWidget):
             # 发送站点名称（字符串），而不是 SiteListItem 对象
             self.delete_site.emit(site_item.site_name)
     
-    def _confirm_delete_site_name(self, site_name: str):
-        """Confirm delete by site name only (fallback)."""
+    def _selected_site_names(self) -> list[str]:
+        """获取所有选中行的站点名称."""
+        rows = sorted(index.row() for index in self.site_table.selectionModel().selectedRows())
+        return [self.model.site_at(row).site_name for row in rows]
+    
+    def _restore_selection(self, site_names: list[str]):
+        """按站点名称一次性恢复选中行（只产生一次选择变化）."""
+        wanted = set(site_names)
+        rows = [row for row in range(self.model.rowCount()) if self.model.site_at(row).site_name in wanted]
+        if not rows:
+            return
+        
+        selection = QItemSelection()
+        for first, last in _row_ranges(rows):
+            selection.select(self.model.index(first, 0), self.model.index(last, self.model.COLUMN_COUNT - 1))
+        
+        selection_model = self.site_table.selectionModel()
+        selection_model.setCurrentIndex(self.model.index(rows[0], 0), QItemSelectionModel.NoUpdate)
+        selection_model.select(selection, QItemSelectionModel.ClearAndSelect | QItemSelectionModel.Rows)
+    
+    def _confirm_delete_site_names(self, site_names: list[str]):
+        """Confirm deleting several sites with a single dialog."""
         reply = QMessageBox.question(
             self,
             self.main_viewmodel.language_manager.get("confirm_delete"),
-            self.main_viewmodel.language_manager.get("delete_confirm_message", name=site_name),
+            self.main_viewmodel.language_manager.get(
+                "delete_sites_confirm_message", count=len(site_names), names=", ".join(site_names)
+            ),
             QMessageBox.Yes | QMessageBox.No
         )
         
         if reply == QMessageBox.Yes:
-            # 直接发送站点名称字符串
-            self.delete_site.emit(site_name)
\ No newline at end of file
+            self.delete_sites.emit(site_names)
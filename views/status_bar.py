@@ -1,5 +1,6 @@
 """Status bar showing Nginx status and controls."""
 
+from typing import Optional
 from PySide6.QtWidgets import (
     QStatusBar, QLabel, QPushButton, QHBoxLayout, QWidget,
     QToolButton, QMenu
@@ -10,6 +11,42 @@ from loguru import logger
 from models.nginx_status import NginxStatus, NginxProcessStatus
 from utils.language_manager import LanguageManager
 
+# 不带格式参数的界面文本，语言切换时统一刷新
+LABEL_KEYS = (
+    "start", "stop", "reload", "nginx_not_running", "nginx_not_started",
+    "cpu_usage", "memory_usage", "uptime",
+)
+
+BLINK_INTERVAL_MS = 500
+
+
+def _set_label_text(label: QLabel, text: str):
+    """仅在文本变化时更新标签，避免无意义的重绘."""
+    if label.text() != text:
+        label.setText(text)
+
+
+def _display_digest(status: NginxStatus) -> tuple:
+    """状态栏实际显示的字段，用于判断状态是否需要重新渲染."""
+    info = status.process_info
+    process_part = None
+    if info is not None:
+        process_part = (len(info.worker_pids), info.cpu_percent,
+                        round(status.get_memory_usage_mb(), 1), status.get_uptime_display())
+    return (status.status, process_part, status.total_sites, tuple(sorted(status.sites_by_type.items())))
+
+
+class ClickableLabel(QLabel):
+    """可点击的标签."""
+    
+    clicked = Signal()
+    
+    def mousePressEvent(self, event):
+        """左键按下时发出clicked信号."""
+        if event.button() == Qt.LeftButton:
+            self.clicked.emit()
+        super().mousePressEvent(event)
+
 
 class StatusBar(QStatusBar):
     """
@@ -20,14 +57,24 @@ class StatusBar(QStatusBar):
     
     status_clicked = Signal()  # 状态点击
     
-    def __init__(self, main_viewmodel):
+    # 状态圆点图标缓存，QPixmap需在QApplication创建后生成，故按需填充
+    _pixmap_cache: dict[str, QPixmap] = {}
+    
+    def __init__(self, main_viewmodel, parent=None):
         """初始化状态栏."""
-        super().__init__()
+        super().__init__(parent)
         self.main_viewmodel = main_viewmodel
         self.language_manager = LanguageManager()
         self._status = NginxStatus()
+        self._labels: dict[str, str] = {}
+        self._last_digest: Optional[tuple] = None
+        self._icon_color: Optional[str] = None  # 当前显示的圆点颜色
+        self._buttons_running: Optional[bool] = None  # 控制按钮当前对应的运行状态
+        self._refresh_labels()
         self._blinking = False
-        self._blink_timer = QTimer()
+        self._blink_hidden = False
+        self._blink_timer = QTimer(self)
+        self._blink_timer.setTimerType(Qt.CoarseTimer)  # 闪烁不需要精确计时
         self._blink_timer.timeout.connect(self._blink_status)
         
         self._setup_ui()
@@ -43,12 +90,12 @@ class StatusBar(QStatusBar):
         status_layout.setContentsMargins(0, 0, 0, 0)
         status_layout.setSpacing(4)
         
-        self.status_icon = QLabel()
+        self.status_icon = ClickableLabel()
         self.status_icon.setFixedSize(16, 16)
         self._update_status_icon()
         status_layout.addWidget(self.status_icon)
         
-        self.status_text = QLabel(self.language_manager.get("nginx_not_running"))
+        self.status_text = QLabel(self._labels["nginx_not_running"])
         status_layout.addWidget(self.status_text)
         
         self.addWidget(status_widget)
@@ -63,20 +110,20 @@ class StatusBar(QStatusBar):
         control_layout.setContentsMargins(0, 0, 0, 0)
         control_layout.setSpacing(4)
         
-        self.start_btn = QPushButton(self.language_manager.get("start"))
+        self.start_btn = QPushButton(self._labels["start"])
         self.start_btn.setFixedWidth(60)
-        self.start_btn.clicked.connect(lambda: self.main_viewmodel.control_nginx("start"))
+        self.start_btn.clicked.connect(self._on_start)
         control_layout.addWidget(self.start_btn)
         
-        self.stop_btn = QPushButton(self.language_manager.get("stop"))
+        self.stop_btn = QPushButton(self._labels["stop"])
         self.stop_btn.setFixedWidth(60)
-        self.stop_btn.clicked.connect(lambda: self.main_viewmodel.control_nginx("stop"))
+        self.stop_btn.clicked.connect(self._on_stop)
         self.stop_btn.setEnabled(False)
         control_layout.addWidget(self.stop_btn)
         
-        self.reload_btn = QPushButton(self.language_manager.get("reload"))
+        self.reload_btn = QPushButton(self._labels["reload"])
         self.reload_btn.setFixedWidth(60)
-        self.reload_btn.clicked.connect(lambda: self.main_viewmodel.control_nginx("reload"))
+        self.reload_btn.clicked.connect(self._on_reload)
         self.reload_btn.setEnabled(False)
         control_layout.addWidget(self.reload_btn)
         
@@ -84,95 +131,102 @@ class StatusBar(QStatusBar):
     
     def _connect_signals(self):
         """连接信号."""
-        self.main_viewmodel.nginx_status_changed.connect(self.update_status)
-        self.status_icon.mousePressEvent = lambda e: self.status_clicked.emit()
+        # nginx_status_changed由MainWindow合并后转发到update_status，这里不再重复连接
+        self.status_icon.clicked.connect(self.status_clicked)
+    
+    @Slot()
+    def _on_start(self):
+        """启动按钮."""
+        self.main_viewmodel.control_nginx("start")
+    
+    @Slot()
+    def _on_stop(self):
+        """停止按钮."""
+        self.main_viewmodel.control_nginx("stop")
+    
+    @Slot()
+    def _on_reload(self):
+        """重载按钮."""
+        self.main_viewmodel.control_nginx("reload")
     
     @Slot(NginxStatus)
     def update_status(self, status: NginxStatus):
         """更新状态."""
+        # 显示内容未变化时跳过文本、图标和按钮的重复设置（闪烁中仍需走完整流程以便停止闪烁）
+        digest = _display_digest(status)
+        if digest == self._last_digest and not self._blinking:
+            return
+        self._last_digest = digest
+        
         self._status = status
+        process_info = status.process_info
+        expected_processes = 3  # 默认期望3个进程（1个master + 2个worker）
         
-        # 更新状态文本 - 根据进程数量显示不同状态
-        if status.is_running() and status.process_info:
+        # 根据进程数量确定状态文本和图标颜色
+        if status.is_running() and process_info:
             # 计算总进程数（master + workers）
-            total_processes = 1 + len(status.process_info.worker_pids)
-            expected_processes = 3  # 默认期望3个进程（1个master + 2个worker）
+            total_processes = 1 + len(process_info.worker_pids)
             
             if total_processes >= expected_processes:
-                # 全部进程正常运行
+                # 全部进程正常运行 - 绿色
                 status_text = self.language_manager.get(
                     "nginx_all_processes_normal",
                     count=total_processes,
                     total=total_processes
                 )
+                self._status.status = NginxProcessStatus.RUNNING
             elif total_processes > 0:
-                # 部分进程异常停止
+                # 部分进程异常停止 - 黄色警告
                 status_text = self.language_manager.get(
                     "nginx_partial_processes_error",
                     count=total_processes,
                     total=expected_processes
                 )
-            else:
-                # 没有检测到进程
-                status_text = self.language_manager.get("nginx_not_running")
-        else:
-            # Nginx未运行
-            status_text = self.language_manager.get("nginx_not_started")
-        
-        self.status_text.setText(status_text)
-        
-        # 更新状态图标 - 根据进程状态设置不同颜色
-        if status.is_running() and status.process_info:
-            total_processes = 1 + len(status.process_info.worker_pids)
-            expected_processes = 3
-            
-            if total_processes >= expected_processes:
-                # 全部进程正常 - 绿色
-                self._status.status = NginxProcessStatus.RUNNING
-            elif total_processes > 0:
-                # 部分进程异常 - 黄色警告
                 self._status.status = NginxProcessStatus.STARTING
             else:
-                # 没有进程 - 灰色
+                # 没有检测到进程 - 灰色
+                status_text = self._labels["nginx_not_running"]
                 self._status.status = NginxProcessStatus.STOPPED
         else:
             # Nginx未运行 - 灰色
+            status_text = self._labels["nginx_not_started"]
             self._status.status = NginxProcessStatus.STOPPED
         
-        # 更新状态图标
+        # 按调整后的状态更新其余部分
+        is_running = status.is_running()
+        
+        _set_label_text(self.status_text, status_text)
         self._update_status_icon()
         
         # 更新信息文本 - 站点统计
+        info_parts = []
         if status.total_sites > 0:
             # 从sites_by_type字典获取各类型站点数量，默认为0
-            static_count = status.sites_by_type.get("static", 0)
-            php_count = status.sites_by_type.get("php", 0)
-            proxy_count = status.sites_by_type.get("proxy", 0)
-            
-            site_stats = self.language_manager.get(
+            sites_by_type = status.sites_by_type
+            info_parts.append(self.language_manager.get(
                 "total_sites", 
                 total=status.total_sites,
-                static=static_count,
-                php=php_count,
-                proxy=proxy_count
-            )
-            self.info_text.setText(site_stats)
-        else:
-            self.info_text.setText("")
+                static=sites_by_type.get("static", 0),
+                php=sites_by_type.get("php", 0),
+                proxy=sites_by_type.get("proxy", 0)
+            ))
         
         # 如果Nginx正在运行，显示资源使用信息
-        if status.process_info and status.is_running():
-            resource_info = f"{self.language_manager.get('cpu_usage')}: {status.process_info.cpu_percent}% | {self.language_manager.get('memory_usage')}: {status.get_memory_usage_mb():.1f}MB | {self.language_manager.get('uptime')}: {status.get_uptime_display()}"
-            if self.info_text.text():
-                self.info_text.setText(f"{self.info_text.text()} | {resource_info}")
-            else:
-                self.info_text.setText(resource_info)
+        if process_info and is_running:
+            labels = self._labels
+            # 内存和运行时长已在计算digest时求出，直接复用
+            _, cpu_percent, memory_mb, uptime = digest[1]
+            info_parts.append(f"{labels['cpu_usage']}: {cpu_percent}%")
+            info_parts.append(f"{labels['memory_usage']}: {memory_mb:.1f}MB")
+            info_parts.append(f"{labels['uptime']}: {uptime}")
+        _set_label_text(self.info_text, " | ".join(info_parts))
         
         # 更新按钮状态
-        is_running = status.is_running()
-        self.start_btn.setEnabled(not is_running)
-        self.stop_btn.setEnabled(is_running)
-        self.reload_btn.setEnabled(is_running)
+        if is_running != self._buttons_running:
+            self._buttons_running = is_running
+            self.start_btn.setEnabled(not is_running)
+            self.stop_btn.setEnabled(is_running)
+            self.reload_btn.setEnabled(is_running)
         
         # 停止闪烁
         if is_running and self._blinking:
@@ -180,41 +234,73 @@ class StatusBar(QStatusBar):
     
     def _update_status_icon(self):
         """更新状态图标."""
-        # 创建彩色圆点图标
-        pixmap = QPixmap(16, 16)
-        pixmap.fill(Qt.transparent)
-        
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        # 设置颜色
-        color = self._status.get_status_color()
-        painter.setBrush(QColor(color))
-        painter.setPen(Qt.NoPen)
-        
-        # 绘制圆点
-        painter.drawEllipse(2, 2, 12, 12)
-        painter.end()
-        
-        self.status_icon.setPixmap(pixmap)
+        self._set_icon_color(self._status.get_status_color())
+    
+    def _set_icon_color(self, color: str):
+        """显示指定颜色的圆点，颜色未变时不重复设置."""
+        if color != self._icon_color:
+            self._icon_color = color
+            self.status_icon.setPixmap(self._status_pixmap(color))
+    
+    @classmethod
+    def _status_pixmap(cls, color: str) -> QPixmap:
+        """获取指定颜色的圆点图标（按颜色缓存）."""
+        pixmap = cls._pixmap_cache.get(color)
+        if pixmap is None:
+            # 创建彩色圆点图标
+            pixmap = QPixmap(16, 16)
+            pixmap.fill(Qt.transparent)
+            
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setBrush(QColor(color))
+            painter.setPen(Qt.NoPen)
+            
+            # 绘制圆点
+            painter.drawEllipse(2, 2, 12, 12)
+            painter.end()
+            
+            cls._pixmap_cache[color] = pixmap
+        return pixmap
     
     def start_blinking(self):
         """开始闪烁（启动中）."""
         self._blinking = True
-        self._blink_timer.start(500)  # 500ms间隔
+        if self.isVisible():
+            self._blink_timer.start(BLINK_INTERVAL_MS)
     
     def _stop_blinking(self):
         """停止闪烁."""
         self._blinking = False
         self._blink_timer.stop()
+        self._blink_hidden = False
         self._update_status_icon()
     
+    @Slot()
     def _blink_status(self):
-        """闪烁状态."""
-        if self.status_icon.isVisible():
-            self.status_icon.setVisible(False)
+        """闪烁状态（切换为透明图标，避免显隐触发状态栏重新布局）."""
+        if not self._blinking:
+            return
+        self._blink_hidden = not self._blink_hidden
+        if self._blink_hidden:
+            self._set_icon_color("transparent")
         else:
-            self.status_icon.setVisible(True)
+            self._update_status_icon()
+    
+    def _refresh_labels(self):
+        """刷新缓存的界面文本."""
+        self._labels = self.language_manager.get_many(LABEL_KEYS)
+    
+    def hideEvent(self, event):
+        """隐藏时（含窗口最小化）暂停闪烁计时器."""
+        super().hideEvent(event)
+        self._blink_timer.stop()
+    
+    def showEvent(self, event):
+        """重新显示时恢复闪烁."""
+        super().showEvent(event)
+        if self._blinking and not self._blink_timer.isActive():
+            self._blink_timer.start(BLINK_INTERVAL_MS)
     
     def paintEvent(self, event):
         """绘制事件."""
@@ -222,10 +308,13 @@ class StatusBar(QStatusBar):
     
     def retranslate_ui(self):
         """重新翻译UI文本."""
+        self._refresh_labels()
+        self._last_digest = None
+        
         # 更新按钮文本
-        self.start_btn.setText(self.language_manager.get("start"))
-        self.stop_btn.setText(self.language_manager.get("stop"))
-        self.reload_btn.setText(self.language_manager.get("reload"))
+        self.start_btn.setText(self._labels["start"])
+        self.stop_btn.setText(self._labels["stop"])
+        self.reload_btn.setText(self._labels["reload"])
         
         # 更新当前状态显示
         self.update_status(self._status)
\ No newline at end of file
@@ -1,319 +1,30 @@
 """Nginx接管对话框。"""
 
-import random
-import string
+import os
+import secrets
 import platform
+import shutil
+import tempfile
+import time
 from pathlib import Path
-from datetime import datetime
+from functools import lru_cache
+from typing import Callable, Optional
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
-    QFileDialog, QMessageBox, QTextEdit, QGroupBox, QCheckBox
+    QFileDialog, QMessageBox, QGroupBox, QCheckBox
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, Signal, QObject, QRunnable, QThreadPool, QTimer
 from loguru import logger
 from utils.language_manager import LanguageManager
 from utils.encoding_utils import read_file_robust
 from utils.config_registry import ConfigRegistry
 
 
-class NginxTakeoverDialog(QDialog):
-    """Nginx接管对话框。"""
-    
-    def __init__(self, parent=None, nginx_dir: str = "", language_manager=None):
-        """
-        初始化接管对话框。
-        
-        Args:
-            parent: 父窗口
-            nginx_dir: 初始Nginx目录
-            language_manager: 语言管理器实例（可选）
-        """
-        super().__init__(parent)
-        self.nginx_dir = Path(nginx_dir) if nginx_dir else None
-        self.backup_path = None
-        # 使用传入的language_manager或创建新实例
-        self.language_manager = language_manager if language_manager else LanguageManager()
-        self.setup_ui()
-    
-    def setup_ui(self):
-        """设置UI。"""
-        self.setWindowTitle(self.language_manager.get("takeover_dialog_title"))
-        self.setMinimumSize(600, 400)
-        
-        layout = QVBoxLayout(self)
-        
-        # 说明
-        desc_label = QLabel(
-            self.language_manager.get("takeover_dialog_description") + "\n" +
-            self.language_manager.get("takeover_dialog_step1") + "\n" +
-            self.language_manager.get("takeover_dialog_step2") + "\n" +
-            self.language_manager.get("takeover_dialog_step3")
-        )
-        desc_label.setWordWrap(True)
-        layout.addWidget(desc_label)
-        
-        # Nginx目录选择
-        dir_group = QGroupBox(self.language_manager.get("takeover_step1_title"))
-        dir_layout = QVBoxLayout()
-        
-        dir_select_layout = QHBoxLayout()
-        self.dir_label = QLabel(str(self.nginx_dir) if self.nginx_dir else self.language_manager.get("not_selected"))
-        self.dir_label.setStyleSheet("padding: 5px; background-color: #f0f0f0;")
-        dir_select_layout.addWidget(self.dir_label)
-        
-        self.select_button = QPushButton(self.language_manager.get("browse"))
-        self.select_button.clicked.connect(self._on_select_dir)
-        dir_select_layout.addWidget(self.select_button)
-        
-        dir_layout.addLayout(dir_select_layout)
-        
-        # 检查结果
-        self.check_result_label = QLabel("")
-        self.check_result_label.setWordWrap(True)
-        self.check_result_label.setStyleSheet("padding: 10px;")
-        dir_layout.addWidget(self.check_result_label)
-        
-        self.check_button = QPushButton(self.language_manager.get("check_nginx_integrity"))
-        self.check_button.clicked.connect(self._on_check_nginx)
-        self.check_button.setEnabled(False)
-        dir_layout.addWidget(self.check_button)
-        
-        dir_group.setLayout(dir_layout)
-        layout.addWidget(dir_group)
-        
-        # 备份选项
-        backup_group = QGroupBox(self.language_manager.get("takeover_step2_title"))
-        backup_layout = QVBoxLayout()
-        
-        self.backup_check = QCheckBox(self.language_manager.get("backup_existing_config"))
-        self.backup_check.setChecked(True)
-        backup_layout.addWidget(self.backup_check)
-        
-        self.backup_info_label = QLabel(self.language_manager.get("backup_filename_format"))
-        self.backup_info_label.setStyleSheet("color: #666; font-size: 12px;")
-        backup_layout.addWidget(self.backup_info_label)
-        
-        backup_group.setLayout(backup_layout)
-        layout.addWidget(backup_group)
-        
-        # 按钮
-        button_layout = QHBoxLayout()
-        button_layout.addStretch()
-        
-        self.cancel_button = QPushButton(self.language_manager.get("cancel"))
-        self.cancel_button.clicked.connect(self.reject)
-        button_layout.addWidget(self.cancel_button)
-        
-        self.takeover_button = QPushButton(self.language_manager.get("execute_takeover"))
-        self.takeover_button.clicked.connect(self._on_takeover)
-        self.takeover_button.setEnabled(False)
-        button_layout.addWidget(self.takeover_button)
-        
-        layout.addLayout(button_layout)
-        
-        # 初始化
-        if self.nginx_dir:
-            self.dir_label.setText(str(self.nginx_dir))
-            self._on_check_nginx()
-    
-    def _on_select_dir(self):
-        """选择Nginx目录。"""
-        dir_path = QFileDialog.getExistingDirectory(
-            self,
-            self.language_manager.get("select_nginx_directory"),
-            str(self.nginx_dir) if self.nginx_dir else ""
-        )
-        
-        if dir_path:
-            self.nginx_dir = Path(dir_path)
-            self.dir_label.setText(dir_path)
-            self.check_button.setEnabled(True)
-            self.check_result_label.setText("")
-            self.check_result_label.setStyleSheet("padding: 10px;")
-            # 自动执行完整性检查
-            self._on_check_nginx()
-    
-    def _on_check_nginx(self):
-        """检查Nginx完整性。"""
-        if not self.nginx_dir:
-            return
-        
-        # 检查必需文件
-        nginx_exe = self.nginx_dir / "nginx.exe"
-        conf_dir = self.nginx_dir / "conf"
-        nginx_conf = conf_dir / "nginx.conf"
-        
-        # mime.types文件可能在conf目录或同级目录
-        mime_types = conf_dir / "mime.types"
-        if not mime_types.exists():
-            mime_types = self.nginx_dir / "mime.types"
-        
-        errors = []
-        warnings = []
-        
-        if not nginx_exe.exists():
-            errors.append(self.language_manager.get("nginx_exe_not_found") + f": {nginx_exe}")
-        else:
-            warnings.append(self.language_manager.get("nginx_exe_found"))
-        
-        if not conf_dir.exists():
-            errors.append(self.language_manager.get("conf_dir_not_found") + f": {conf_dir}")
-        else:
-            warnings.append(self.language_manager.get("conf_dir_found"))
-        
-        if not nginx_conf.exists():
-            errors.append(self.language_manager.get("nginx_conf_not_found") + f": {nginx_conf}" + self.language_manager.get("will_create_new_config"))
-        else:
-            warnings.append(self.language_manager.get("nginx_conf_found"))
-        
-        if not mime_types.exists():
-            errors.append(self.language_manager.get("mime_types_not_found") + f": {mime_types}" + self.language_manager.get("may_cause_config_issues"))
-        else:
-            warnings.append(self.language_manager.get("mime_types_found"))
-        
-        # 显示结果
-        if errors:
-            result_text = "\n".join(errors + warnings)
-            self.check_result_label.setText(result_text)
-            self.check_result_label.setStyleSheet("padding: 10px; color: #d32f2f;")
-            self.takeover_button.setEnabled(False)
-        else:
-            result_text = self.language_manager.get("nginx_installation_complete") + "\n\n" + "\n".join(warnings)
-            self.check_result_label.setText(result_text)
-            self.check_result_label.setStyleSheet("padding: 10px; color: #388e3c;")
-            self.takeover_button.setEnabled(True)
-    
-    def _generate_optimized_config_preview(self) -> str:
-        """生成优化的配置预览。"""
-        # 根据操作系统选择事件模型
-        event_model = "select" if platform.system() == "Windows" else "epoll"
-        return f"""# 全局性能优化配置
-worker_processes auto;
-worker_rlimit_nofile 8192;
-error_log logs/error.log warn;
+# 根据操作系统选择事件模型
+_EVENT_MODEL = "select" if platform.system() == "Windows" else "epoll"
 
-# Events优化
-events {{
-    worker_connections 1024;
-    multi_accept on;
-    use {event_model};
-}}
-
-# HTTP性能和安全性优化
-http {{
-    include mime.types;
-    default_type application/octet-stream;
-    
-    # 性能优化
-    sendfile on;
-    tcp_nopush on;
-    tcp_nodelay on;
-    keepalive_timeout 65;
-    keepalive_requests 100;
-    
-    # 安全性
-    server_tokens off;
-    client_max_body_size 50m;
-    
-    # Gzip压缩
-    gzip on;
-    gzip_vary on;
-    gzip_min_length 1024;
-    gzip_types text/plain text/css text/xml text/javascript application/json application/javascript application/xml+rss application/xml image/svg+xml;
-}}"""""
-    
-    def _on_takeover(self):
-        """执行接管。"""
-        if not self.nginx_dir:
-            QMessageBox.warning(self, self.language_manager.get("error"), self.language_manager.get("please_select_nginx_directory"))
-            return
-        
-        try:
-            # 0. 生成站点配置目录随机标识符
-            config_registry = ConfigRegistry()
-            site_conf_random = config_registry.generate_site_conf_random()
-            logger.info(f"Generated site conf directory identifier: {site_conf_random}")
-            
-            # 1. 备份现有配置
-            if self.backup_check.isChecked():
-                conf_dir = self.nginx_dir / "conf"
-                nginx_conf = conf_dir / "nginx.conf"
-                
-                if nginx_conf.exists():
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    random_str = ''.join(random.choices(string.ascii_letters + string.digits, k=8))
-                    backup_name = f"{timestamp}_{random_str}.nginx.conf.bk"
-                    backup_path = conf_dir / backup_name
-                    
-                    # 创建备份（使用健壮的编码检测）
-                    content = read_file_robust(nginx_conf)
-                    if content is None:
-                        logger.error(f"无法读取配置文件: {nginx_conf}")
-                        raise Exception(f"无法读取配置文件: {nginx_conf}")
-                    backup_path.write_text(content, encoding="utf-8")
-                    
-                    self.backup_path = backup_path
-                    logger.info(f"Config backed up to: {backup_path}")
-            
-            # 2. 创建新的优化配置
-            conf_dir = self.nginx_dir / "conf"
-            conf_dir.mkdir(exist_ok=True)
-            
-            nginx_conf = conf_dir / "nginx.conf"
-            optimized_config = self._generate_full_optimized_config(site_conf_random)
-            nginx_conf.write_text(optimized_config, encoding="utf-8")
-            
-            # 3. 创建站点配置目录
-            site_conf_dir = conf_dir / f"{site_conf_random}_conf.d"
-            site_conf_dir.mkdir(exist_ok=True)
-            logger.info(f"Created site config directory: {site_conf_dir}")
-            
-            # 4. 创建mime.types（如果不存在）
-            mime_types = conf_dir / "mime.types"
-            if not mime_types.exists():
-                mime_content = self._generate_mime_types()
-                mime_types.write_text(mime_content, encoding="utf-8")
-            
-            logger.info(f"Takeover completed successfully: {self.nginx_dir}")
-            logger.info(f"Site config directory identifier: {site_conf_random}")
-            logger.info(f"Site configs will be saved to: {site_conf_dir}")
-            
-            # 显示成功信息
-            msg = self.language_manager.get("takeover_success_message") + f"\n\n" + self.language_manager.get("nginx_directory") + f": {self.nginx_dir}\n"
-            if self.backup_path:
-                msg += self.language_manager.get("backup_file") + f": {self.backup_path.name}"
-            
-            QMessageBox.information(self, self.language_manager.get("takeover_success"), msg)
-            self.accept()
-            
-        except Exception as e:
-            logger.error(f"Takeover failed: {e}")
-            QMessageBox.critical(self, self.language_manager.get("takeover_failed"), self.language_manager.get("takeover_error_occurred") + f":\n{str(e)}")
-    
-    def _generate_full_optimized_config(self, site_conf_random: str = "conf") -> str:
-        """生成完整的优化配置（不包含站点信息）."""
-        # 读取模板文件（使用健壮的编码检测）
-        template_path = Path(__file__).parent.parent / "templates" / "nginx_base.conf"
-        if template_path.exists():
-            content = read_file_robust(template_path)
-            if content:
-                # 使用模板，但替换其中的 include 指令（使用随机数命名）
-                include_directive = f"include {site_conf_random}_conf.d/*.conf;"
-                # 替换模板中的 include conf.d/*.conf;
-                content = content.replace("include conf.d/*.conf;", include_directive)
-                # 也替换注释中的说明
-                content = content.replace("stored in the conf.d/ directory", f"stored in the {site_conf_random}_conf.d/ directory")
-                content = content.replace("conf.d/<site_name>.conf", f"{site_conf_random}_conf.d/<site_name>.conf")
-                
-                logger.info(f"Using template with custom include directive: {include_directive}")
-                return content
-            else:
-                logger.warning("无法读取模板文件，使用内联配置")
-        
-        # 如果模板不存在，使用内联配置（不包含任何server块）
-        logger.warning("nginx_base.conf template not found, using inline config")
-        event_model = "select" if platform.system() == "Windows" else "epoll"
-        return f"""# Nginx Configuration - Generated by easyNginx
+# 找不到nginx_base.conf模板时使用的内联配置（不包含任何server块）
+_INLINE_CONFIG_TEMPLATE = """# Nginx Configuration - Generated by easyNginx
 # Performance optimized and security hardened
 # Based on F5/CIS best practices
 #
@@ -435,10 +146,8 @@ http {{
     # ============================================
     include {site_conf_random}_conf.d/*.conf;
 }}"""
-    
-    def _generate_mime_types(self) -> str:
-        """生成mime.types文件内容。"""
-        return """types {
+
+_MIME_TYPES = """types {
     text/html                             html htm shtml;
     text/css                              css;
     text/xml                              xml;
@@ -527,6 +236,474 @@ http {{
     video/x-msvideo                       avi;
 }
 """
+_MIME_TYPES_BYTES = _MIME_TYPES.encode("utf-8")
+
+
+# 界面中使用的文本，构建界面时一次取出
+_UI_TEXT_KEYS = (
+    "takeover_dialog_title", "takeover_dialog_description", "takeover_dialog_step1",
+    "takeover_dialog_step2", "takeover_dialog_step3", "takeover_step1_title",
+    "not_selected", "browse", "check_nginx_integrity", "takeover_step2_title",
+    "backup_existing_config", "backup_filename_format", "cancel", "execute_takeover",
+)
+
+# 完整性检查结果中使用的文本
+_CHECK_TEXT_KEYS = (
+    "nginx_exe_not_found", "nginx_exe_found", "conf_dir_not_found", "conf_dir_found",
+    "nginx_conf_not_found", "will_create_new_config", "nginx_conf_found",
+    "mime_types_not_found", "may_cause_config_issues", "mime_types_found",
+    "nginx_installation_complete",
+)
+
+
+# 完整性检查结果标签的样式
+_RESULT_ERROR_STYLE = "padding: 10px; color: #d32f2f;"
+_RESULT_OK_STYLE = "padding: 10px; color: #388e3c;"
+
+_BASE_TEMPLATE_PATH = Path(__file__).parent.parent / "templates" / "nginx_base.conf"
+
+
+@lru_cache(maxsize=1)
+def _load_base_template() -> Optional[str]:
+    """读取nginx_base.conf模板（进程内只读取一次），不存在或无法读取时返回None。"""
+    if not _BASE_TEMPLATE_PATH.exists():
+        return None
+    # 使用健壮的编码检测
+    content = read_file_robust(_BASE_TEMPLATE_PATH)
+    if not content:
+        logger.warning("无法读取模板文件，使用内联配置")
+        return None
+    return content
+
+
+# 目录列表缓存：路径 -> (列出时间, {条目名: 是否为目录})，短时间内重复检查同一目录时复用
+_LISTING_TTL = 2.0  # 秒
+_listing_cache: dict[Path, tuple[float, dict[str, bool]]] = {}
+
+
+def _dir_entries(path: Path) -> dict[str, bool]:
+    """列出目录中的条目（名称按平台规则规范大小写）及其是否为目录，目录不存在时返回空字典。"""
+    now = time.monotonic()
+    cached = _listing_cache.get(path)
+    if cached is not None and now - cached[0] < _LISTING_TTL:
+        return cached[1]
+    
+    entries = {}
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                # is_dir()直接使用readdir返回的类型信息，通常不需要额外的stat
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    continue
+                entries[os.path.normcase(entry.name)] = is_dir
+    except OSError:
+        pass
+    _listing_cache[path] = (now, entries)
+    return entries
+
+
+def _mtime_ns(path: Path) -> int:
+    """获取目录的修改时间（纳秒），不存在时返回-1。"""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return -1
+
+
+def _has_file(entries: dict[str, bool], name: str) -> bool:
+    """判断目录条目中是否有指定名称的文件。"""
+    return entries.get(os.path.normcase(name)) is False
+
+
+def _has_dir(entries: dict[str, bool], name: str) -> bool:
+    """判断目录条目中是否有指定名称的子目录。"""
+    return entries.get(os.path.normcase(name)) is True
+
+
+def _atomic_write_bytes(path: Path, data: bytes):
+    """先写入同目录下的临时文件再替换目标文件，避免中途失败留下不完整的配置。"""
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        # mkstemp创建的文件权限为0600，保持与原文件（或普通新文件）一致
+        if path.exists():
+            shutil.copymode(path, tmp_name)
+        else:
+            os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def _apply_takeover(nginx_dir: Path, backup: bool, site_conf_random: str, config_text: str) -> Optional[Path]:
+    """执行接管的文件操作，返回备份文件路径（未备份时为None）。"""
+    conf_dir = nginx_dir / "conf"
+    nginx_conf = conf_dir / "nginx.conf"
+    backup_path = None
+    
+    # 1. 备份现有配置
+    if backup and nginx_conf.exists():
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        random_str = secrets.token_hex(4)
+        backup_name = f"{timestamp}_{random_str}.nginx.conf.bk"
+        backup_path = conf_dir / backup_name
+        
+        # 创建备份（按字节原样复制，保留原有编码和换行）
+        shutil.copyfile(nginx_conf, backup_path)
+        logger.info(f"Config backed up to: {backup_path}")
+    
+    # 2. 创建新的优化配置
+    conf_dir.mkdir(exist_ok=True)
+    _atomic_write_bytes(nginx_conf, config_text.encode("utf-8"))
+    
+    # 3. 创建站点配置目录
+    site_conf_dir = conf_dir / f"{site_conf_random}_conf.d"
+    site_conf_dir.mkdir(exist_ok=True)
+    logger.info(f"Created site config directory: {site_conf_dir}")
+    
+    # 4. 创建mime.types（如果不存在）；Nginx目录下已有的mime.types优先复制，保留用户自定义内容
+    mime_types = conf_dir / "mime.types"
+    if not mime_types.exists():
+        root_mime_types = nginx_dir / "mime.types"
+        if root_mime_types.is_file():
+            shutil.copyfile(root_mime_types, mime_types)
+        else:
+            _atomic_write_bytes(mime_types, _MIME_TYPES_BYTES)
+    
+    logger.info(f"Takeover completed successfully: {nginx_dir}")
+    logger.info(f"Site config directory identifier: {site_conf_random}")
+    logger.info(f"Site configs will be saved to: {site_conf_dir}")
+    return backup_path
+
+
+class _TakeoverSignals(QObject):
+    """接管任务的结果信号（在GUI线程接收）。"""
+    
+    succeeded = Signal(object)  # 备份文件路径或None
+    failed = Signal(str)
+
+
+class _TakeoverTask(QRunnable):
+    """在线程池中执行接管的文件操作。"""
+    
+    def __init__(self, nginx_dir: Path, backup: bool, site_conf_random: str,
+                 build_config: Callable[[str], str], signals: _TakeoverSignals):
+        super().__init__()
+        self.nginx_dir = nginx_dir
+        self.backup = backup
+        self.site_conf_random = site_conf_random
+        self.build_config = build_config
+        self.signals = signals
+    
+    def run(self):
+        try:
+            config_text = self.build_config(self.site_conf_random)
+            backup_path = _apply_takeover(self.nginx_dir, self.backup, self.site_conf_random, config_text)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.succeeded.emit(backup_path)
+
+
+class NginxTakeoverDialog(QDialog):
+    """Nginx接管对话框。"""
+    
+    def __init__(self, parent=None, nginx_dir: str = "", language_manager=None):
+        """
+        初始化接管对话框。
+        
+        Args:
+            parent: 父窗口
+            nginx_dir: 初始Nginx目录
+            language_manager: 语言管理器实例（可选）
+        """
+        super().__init__(parent)
+        self._set_nginx_dir(Path(nginx_dir) if nginx_dir else None)
+        self.backup_path = None
+        self._takeover_running = False
+        self._takeover_signals = _TakeoverSignals(self)
+        self._takeover_signals.succeeded.connect(self._on_takeover_succeeded)
+        self._takeover_signals.failed.connect(self._on_takeover_failed)
+        # 选择目录后的完整性检查，多次触发合并为一次
+        self._check_timer = QTimer(self)
+        self._check_timer.setSingleShot(True)
+        self._check_timer.setInterval(0)
+        self._check_timer.timeout.connect(self._on_check_nginx)
+        # 使用传入的language_manager或创建新实例
+        self.language_manager = language_manager if language_manager else LanguageManager()
+        # 对话框为模态，打开期间语言不会切换，检查结果文本只取一次
+        self._check_texts = self.language_manager.get_many(_CHECK_TEXT_KEYS)
+        self._last_check_key: Optional[tuple] = None  # 上次检查时的(目录, 目录mtime, conf目录mtime)
+        self.setup_ui()
+    
+    def setup_ui(self):
+        """设置UI。"""
+        texts = self.language_manager.get_many(_UI_TEXT_KEYS)
+        self.setWindowTitle(texts["takeover_dialog_title"])
+        self.setMinimumSize(600, 400)
+        
+        layout = QVBoxLayout(self)
+        
+        # 说明
+        desc_label = QLabel(
+            texts["takeover_dialog_description"] + "\n" +
+            texts["takeover_dialog_step1"] + "\n" +
+            texts["takeover_dialog_step2"] + "\n" +
+            texts["takeover_dialog_step3"]
+        )
+        desc_label.setWordWrap(True)
+        layout.addWidget(desc_label)
+        
+        # Nginx目录选择
+        dir_group = QGroupBox(texts["takeover_step1_title"])
+        dir_layout = QVBoxLayout()
+        
+        dir_select_layout = QHBoxLayout()
+        self.dir_label = QLabel(str(self.nginx_dir) if self.nginx_dir else texts["not_selected"])
+        self.dir_label.setStyleSheet("padding: 5px; background-color: #f0f0f0;")
+        dir_select_layout.addWidget(self.dir_label)
+        
+        self.select_button = QPushButton(texts["browse"])
+        self.select_button.clicked.connect(self._on_select_dir)
+        dir_select_layout.addWidget(self.select_button)
+        
+        dir_layout.addLayout(dir_select_layout)
+        
+        # 检查结果
+        self.check_result_label = QLabel("")
+        self.check_result_label.setWordWrap(True)
+        self.check_result_label.setStyleSheet("padding: 10px;")
+        dir_layout.addWidget(self.check_result_label)
+        
+        self.check_button = QPushButton(texts["check_nginx_integrity"])
+        self.check_button.clicked.connect(self._on_recheck_nginx)
+        self.check_button.setEnabled(False)
+        dir_layout.addWidget(self.check_button)
+        
+        dir_group.setLayout(dir_layout)
+        layout.addWidget(dir_group)
+        
+        # 备份选项
+        backup_group = QGroupBox(texts["takeover_step2_title"])
+        backup_layout = QVBoxLayout()
+        
+        self.backup_check = QCheckBox(texts["backup_existing_config"])
+        self.backup_check.setChecked(True)
+        backup_layout.addWidget(self.backup_check)
+        
+        self.backup_info_label = QLabel(texts["backup_filename_format"])
+        self.backup_info_label.setStyleSheet("color: #666; font-size: 12px;")
+        backup_layout.addWidget(self.backup_info_label)
+        
+        backup_group.setLayout(backup_layout)
+        layout.addWidget(backup_group)
+        
+        # 按钮
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        
+        self.cancel_button = QPushButton(texts["cancel"])
+        self.cancel_button.clicked.connect(self.reject)
+        button_layout.addWidget(self.cancel_button)
+        
+        self.takeover_button = QPushButton(texts["execute_takeover"])
+        self.takeover_button.clicked.connect(self._on_takeover)
+        self.takeover_button.setEnabled(False)
+        button_layout.addWidget(self.takeover_button)
+        
+        layout.addLayout(button_layout)
+        
+        # 初始化
+        if self.nginx_dir:
+            self.dir_label.setText(str(self.nginx_dir))
+            self._on_check_nginx()
+    
+    def _set_nginx_dir(self, nginx_dir: Optional[Path]):
+        """设置Nginx目录，并预先生成检查和接管用到的路径。"""
+        self.nginx_dir = nginx_dir
+        if nginx_dir is None:
+            self._nginx_exe = self._conf_dir = self._nginx_conf = None
+            self._mime_types_conf = self._mime_types_root = None
+            return
+        self._nginx_exe = nginx_dir / "nginx.exe"
+        self._conf_dir = nginx_dir / "conf"
+        self._nginx_conf = self._conf_dir / "nginx.conf"
+        self._mime_types_conf = self._conf_dir / "mime.types"
+        self._mime_types_root = nginx_dir / "mime.types"
+    
+    def _on_select_dir(self):
+        """选择Nginx目录。"""
+        dir_path = QFileDialog.getExistingDirectory(
+            self,
+            self.language_manager.get("select_nginx_directory"),
+            str(self.nginx_dir) if self.nginx_dir else ""
+        )
+        
+        if dir_path:
+            self._set_nginx_dir(Path(dir_path))
+            self.dir_label.setText(dir_path)
+            self.check_button.setEnabled(True)
+            # 只清空文本：空标签上的颜色样式不可见，检查完成后再一次性设置样式
+            self.check_result_label.setText("")
+            self._last_check_key = None
+            # 自动执行完整性检查（推迟到当前事件处理完之后，先刷新目录显示）
+            self._check_timer.start()
+    
+    def _on_recheck_nginx(self):
+        """手动检查时忽略目录列表缓存和上次的检查结果。"""
+        _listing_cache.clear()
+        self._last_check_key = None
+        self._on_check_nginx()
+    
+    def _on_check_nginx(self):
+        """检查Nginx完整性。"""
+        if not self.nginx_dir:
+            return
+        
+        # 目录及conf目录的修改时间未变时条目不会增减，上次的检查结果仍然有效
+        check_key = (str(self.nginx_dir), _mtime_ns(self.nginx_dir), _mtime_ns(self._conf_dir))
+        if check_key == self._last_check_key:
+            return
+        
+        # 检查必需文件（每个目录只枚举一次，代替逐个文件stat）
+        nginx_exe = self._nginx_exe
+        conf_dir = self._conf_dir
+        nginx_conf = self._nginx_conf
+        top_entries = _dir_entries(self.nginx_dir)
+        conf_entries = _dir_entries(conf_dir)
+        
+        # mime.types文件可能在conf目录或同级目录
+        mime_types = self._mime_types_conf
+        has_mime_types = _has_file(conf_entries, "mime.types")
+        if not has_mime_types:
+            mime_types = self._mime_types_root
+            has_mime_types = _has_file(top_entries, "mime.types")
+        
+        texts = self._check_texts
+        errors = []
+        warnings = []
+        
+        # (是否存在, 路径, 存在时的文本, 缺失时的文本, 缺失时的附加说明)
+        checks = (
+            (_has_file(top_entries, "nginx.exe"), nginx_exe, "nginx_exe_found", "nginx_exe_not_found", None),
+            (_has_dir(top_entries, "conf"), conf_dir, "conf_dir_found", "conf_dir_not_found", None),
+            (_has_file(conf_entries, "nginx.conf"), nginx_conf, "nginx_conf_found", "nginx_conf_not_found", "will_create_new_config"),
+            (has_mime_types, mime_types, "mime_types_found", "mime_types_not_found", "may_cause_config_issues"),
+        )
+        for present, path, found_key, missing_key, note_key in checks:
+            if present:
+                warnings.append(texts[found_key])
+            else:
+                message = texts[missing_key] + f": {path}"
+                if note_key:
+                    message += texts[note_key]
+                errors.append(message)
+        
+        # 显示结果
+        if errors:
+            lines = errors
+        else:
+            lines = [texts["nginx_installation_complete"], ""]
+        lines.extend(warnings)
+        passed = not errors
+        self._show_check_result("\n".join(lines), _RESULT_OK_STYLE if passed else _RESULT_ERROR_STYLE, passed)
+        self._last_check_key = check_key
+    
+    def _show_check_result(self, text: str, style: str, passed: bool):
+        """显示检查结果，样式和按钮状态只在变化时更新。"""
+        self.check_result_label.setText(text)
+        if self.check_result_label.styleSheet() != style:
+            self.check_result_label.setStyleSheet(style)
+        if self.takeover_button.isEnabled() != passed:
+            self.takeover_button.setEnabled(passed)
+    
+    def _on_takeover(self):
+        """执行接管（文件操作在线程池中进行，避免阻塞界面）。"""
+        if not self.nginx_dir:
+            QMessageBox.warning(self, self.language_manager.get("error"), self.language_manager.get("please_select_nginx_directory"))
+            return
+        
+        try:
+            # 0. 生成站点配置目录随机标识符
+            config_registry = ConfigRegistry()
+            site_conf_random = config_registry.generate_site_conf_random()
+            logger.info(f"Generated site conf directory identifier: {site_conf_random}")
+        except Exception as e:
+            self._on_takeover_failed(str(e))
+            return
+        
+        # 执行期间禁用按钮，并阻止关闭对话框
+        self._takeover_running = True
+        self._set_buttons_enabled(False)
+        task = _TakeoverTask(
+            self.nginx_dir, self.backup_check.isChecked(), site_conf_random,
+            self._generate_full_optimized_config, self._takeover_signals
+        )
+        QThreadPool.globalInstance().start(task)
+    
+    def _on_takeover_succeeded(self, backup_path):
+        """接管完成（GUI线程）。"""
+        self._takeover_running = False
+        self.backup_path = backup_path
+        # 接管修改了目录内容，丢弃缓存的目录列表
+        _listing_cache.clear()
+        
+        # 显示成功信息
+        msg = self.language_manager.get("takeover_success_message") + f"\n\n" + self.language_manager.get("nginx_directory") + f": {self.nginx_dir}\n"
+        if self.backup_path:
+            msg += self.language_manager.get("backup_file") + f": {self.backup_path.name}"
+        
+        # 以窗口模态方式显示，不进入嵌套事件循环；关闭提示后再结束对话框
+        box = QMessageBox(QMessageBox.Information, self.language_manager.get("takeover_success"), msg, QMessageBox.Ok, self)
+        box.setAttribute(Qt.WA_DeleteOnClose)
+        box.finished.connect(self.accept)
+        box.open()
+    
+    def _on_takeover_failed(self, error: str):
+        """接管失败（GUI线程）。"""
+        self._takeover_running = False
+        self._set_buttons_enabled(True)
+        logger.error(f"Takeover failed: {error}")
+        QMessageBox.critical(self, self.language_manager.get("takeover_failed"), self.language_manager.get("takeover_error_occurred") + f":\n{error}")
+    
+    def _set_buttons_enabled(self, enabled: bool):
+        """启用/禁用对话框按钮。"""
+        self.select_button.setEnabled(enabled)
+        self.cancel_button.setEnabled(enabled)
+        self.takeover_button.setEnabled(enabled)
+    
+    def reject(self):
+        """接管执行中不允许关闭对话框。"""
+        if self._takeover_running:
+            return
+        super().reject()
+    
+    @staticmethod
+    def _generate_full_optimized_config(site_conf_random: str = "conf") -> str:
+        """生成完整的优化配置（不包含站点信息）."""
+        content = _load_base_template()
+        if content:
+            # 使用模板，但替换其中的 include 指令（使用随机数命名）
+            include_directive = f"include {site_conf_random}_conf.d/*.conf;"
+            # 替换模板中的 include conf.d/*.conf;
+            content = content.replace("include conf.d/*.conf;", include_directive)
+            # 也替换注释中的说明
+            content = content.replace("stored in the conf.d/ directory", f"stored in the {site_conf_random}_conf.d/ directory")
+            content = content.replace("conf.d/<site_name>.conf", f"{site_conf_random}_conf.d/<site_name>.conf")
+            
+            logger.info(f"Using template with custom include directive: {include_directive}")
+            return content
+        
+        # 如果模板不存在，使用内联配置（不包含任何server块）
+        logger.warning("nginx_base.conf template not found, using inline config")
+        return _INLINE_CONFIG_TEMPLATE.format(site_conf_random=site_conf_random, event_model=_EVENT_MODEL)
     
     def get_nginx_paths(self) -> tuple[str, str]:
         """
@@ -538,7 +715,4 @@ http {{
         if not self.nginx_dir:
             return "", ""
         
-        nginx_exe = self.nginx_dir / "nginx.exe"
-        nginx_conf = self.nginx_dir / "conf" / "nginx.conf"
-        
-        return str(nginx_exe), str(nginx_conf)
+        return str(self._nginx_exe), str(self._nginx_conf)